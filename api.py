@@ -8,7 +8,7 @@ HTTP requests and returns the extracted skills with proficiency levels.
 """
 
 import os
-import json
+import orjson
 import shutil
 import tempfile
 import uuid
@@ -94,7 +94,7 @@ def extract_skills():
     if not saved_files:
         return jsonify({'error': 'No valid files uploaded'}), 400
     
-    logger.info(f"Processing {len(saved_files)} files for session {session_id}")
+    logger.info("Processing %s files for session %s", len(saved_files), session_id)
     
     try:
         # Process files
@@ -112,7 +112,7 @@ def extract_skills():
         })
     
     except Exception as e:
-        logger.error(f"Error processing files: {str(e)}")
+        logger.error("Error processing files: %s", e)
         return jsonify({'error': f'Error processing files: {str(e)}'}), 500
 
 @app.route('/api/results/<session_id>/<filename>', methods=['GET'])
@@ -168,22 +168,26 @@ def process_files(file_paths, output_dir):
     detected_industry = "general"
     industry_scores = {}
     
-    # Categorize files
-    resume_files = [f for f in file_paths if document_processor.is_resume(f)]
-    cert_files = [f for f in file_paths if document_processor.is_certification(f)]
-    other_files = [f for f in file_paths if f not in resume_files and f not in cert_files]
+    # Categorize files in a single pass
+    file_buckets = {'resumes': [], 'certifications': [], 'unknown': []}
+    for category, file_path in document_processor.categorize_files(file_paths):
+        file_buckets[category].append(file_path)
     
-    logger.info(f"Found {len(resume_files)} resume files, {len(cert_files)} certification files, and {len(other_files)} other files")
+    resume_files = file_buckets['resumes']
+    cert_files = file_buckets['certifications']
+    other_files = file_buckets['unknown']
+    
+    logger.info("Found %s resume files, %s certification files, and %s other files", len(resume_files), len(cert_files), len(other_files))
     
     # Process certification files first
     for file_path in cert_files:
-        logger.info(f"Processing certification: {os.path.basename(file_path)}")
+        logger.info("Processing certification: %s", os.path.basename(file_path))
         
         # Extract text
         extracted_text = document_processor.process_file(file_path)
         
         if not extracted_text:
-            logger.warning(f"Failed to extract text from {file_path}")
+            logger.warning("Failed to extract text from %s", file_path)
             continue
         
         # Store certification text for context
@@ -191,25 +195,25 @@ def process_files(file_paths, output_dir):
         
         # Extract skills
         file_skills = skill_processor.extract_skills(extracted_text)
-        logger.info(f"Extracted {len(file_skills)} skills from certification")
+        logger.info("Extracted %s skills from certification", len(file_skills))
         cert_skills.extend(file_skills)
     
     # Process resume files
     for file_path in resume_files:
-        logger.info(f"Processing resume: {os.path.basename(file_path)}")
+        logger.info("Processing resume: %s", os.path.basename(file_path))
         resume_file = os.path.basename(file_path)
         
         # Extract text
         extracted_text = document_processor.process_file(file_path)
         
         if not extracted_text:
-            logger.warning(f"Failed to extract text from {file_path}")
+            logger.warning("Failed to extract text from %s", file_path)
             continue
         
         # Detect industry for targeted skill extraction
         from extract_and_process import detect_industry
         detected_industry, industry_scores = detect_industry(extracted_text)
-        logger.info(f"Detected industry: {detected_industry}")
+        logger.info("Detected industry: %s", detected_industry)
         
         # Update processors for industry-specific extraction
         if hasattr(skill_processor, 'update_for_industry'):
@@ -223,12 +227,12 @@ def process_files(file_paths, output_dir):
         
         # Additionally, extract skills from sentences in the resume
         sentence_skills = sentence_extractor.extract_skills_from_text(extracted_text)
-        logger.info(f"Extracted {len(sentence_skills)} additional skills from sentences")
+        logger.info("Extracted %s additional skills from sentences", len(sentence_skills))
         
         # Combine skills from both extraction methods
         file_skills.extend(sentence_skills)
         
-        logger.info(f"Extracted {len(file_skills)} skills from resume (industry: {detected_industry})")
+        logger.info("Extracted %s skills from resume (industry: %s)", len(file_skills), detected_industry)
         
         # Mark backed skills
         backed_skills = skill_processor.mark_backed_skills(file_skills, cert_skills)
@@ -238,19 +242,19 @@ def process_files(file_paths, output_dir):
     if not resume_skills and other_files:
         logger.info("No resume files found, treating other files as resumes")
         for file_path in other_files:
-            logger.info(f"Processing file as resume: {os.path.basename(file_path)}")
+            logger.info("Processing file as resume: %s", os.path.basename(file_path))
             resume_file = os.path.basename(file_path)
             
             # Extract text
             extracted_text = document_processor.process_file(file_path)
             
             if not extracted_text:
-                logger.warning(f"Failed to extract text from {file_path}")
+                logger.warning("Failed to extract text from %s", file_path)
                 continue
             
             # Extract skills
             file_skills = skill_processor.extract_skills(extracted_text)
-            logger.info(f"Extracted {len(file_skills)} skills")
+            logger.info("Extracted %s skills", len(file_skills))
             
             # Mark backed skills if cert skills exist
             if cert_skills:
@@ -302,15 +306,15 @@ def process_files(file_paths, output_dir):
             if is_database_skill:
                 db_section_match = re.search(r'database|data|sql|query', resume_text, re.IGNORECASE)
                 if not db_section_match:
-                    logger.warning(f"Skipping database skill {skill['name']} - not explicitly mentioned in resume")
+                    logger.warning("Skipping database skill %s - not explicitly mentioned in resume", skill['name'])
                     continue
             elif is_teaching_skill:
                 teaching_section_match = re.search(r'teaching|education|instruction|curriculum', resume_text, re.IGNORECASE)
                 if not teaching_section_match:
-                    logger.warning(f"Skipping teaching skill {skill['name']} - not explicitly mentioned in resume")
+                    logger.warning("Skipping teaching skill %s - not explicitly mentioned in resume", skill['name'])
                     continue
             else:
-                logger.warning(f"Skipping skill {skill['name']} - not explicitly mentioned in resume")
+                logger.warning("Skipping skill %s - not explicitly mentioned in resume", skill['name'])
                 continue
             
         # Special handling for potentially problematic skills
@@ -325,7 +329,7 @@ def process_files(file_paths, output_dir):
             ])
             
             if not programming_context:
-                logger.warning(f"Skipping ambiguous skill {skill['name']} - not in programming context")
+                logger.warning("Skipping ambiguous skill %s - not in programming context", skill['name'])
                 continue
         
         # Calculate proficiency
@@ -347,7 +351,7 @@ def process_files(file_paths, output_dir):
     
     # Post-process extracted skills to validate and remove non-skills
     validated_skills = skill_validator.validate_skills(processed_skills)
-    logger.info(f"Validated skills: {len(validated_skills)} out of {len(processed_skills)} original skills")
+    logger.info("Validated skills: %s out of %s original skills", len(validated_skills), len(processed_skills))
     
     # Sort validated skills by name
     validated_skills.sort(key=lambda x: x["name"])
@@ -365,8 +369,8 @@ def process_files(file_paths, output_dir):
     }
     
     # Save results to files
-    with open(os.path.join(output_dir, "skills.json"), 'w', encoding='utf-8') as f:
-        json.dump(result, f, indent=2)
+    with open(os.path.join(output_dir, "skills.json"), 'wb') as f:
+        f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
     
     # Create markdown summary
     from summarize_skills import generate_summary
@@ -389,7 +393,7 @@ def cleanup_old_sessions(max_age_hours=24):
         if os.path.isdir(session_dir):
             # Check directory modification time
             if os.path.getmtime(session_dir) < cutoff_time:
-                logger.info(f"Cleaning up old upload session: {session_id}")
+                logger.info("Cleaning up old upload session: %s", session_id)
                 shutil.rmtree(session_dir, ignore_errors=True)
     
     # Clean up results directory
@@ -398,7 +402,7 @@ def cleanup_old_sessions(max_age_hours=24):
         if os.path.isdir(results_dir):
             # Check directory modification time
             if os.path.getmtime(results_dir) < cutoff_time:
-                logger.info(f"Cleaning up old results session: {session_id}")
+                logger.info("Cleaning up old results session: %s", session_id)
                 shutil.rmtree(results_dir, ignore_errors=True)
 
 if __name__ == '__main__':
@@ -411,7 +415,7 @@ if __name__ == '__main__':
             try:
                 cleanup_old_sessions()
             except Exception as e:
-                logger.error(f"Error in cleanup job: {str(e)}")
+                logger.error("Error in cleanup job: %s", e)
             time.sleep(3600)  # Sleep for 1 hour
     
     cleanup_thread = threading.Thread(target=cleanup_job)
@@ -19,8 +19,10 @@ from PIL import Image
 import pytesseract
 import spacy
 import re
+import functools
 from collections import defaultdict
 import openai
+import ahocorasick
 
 # Configure logging
 logging.basicConfig(
@@ -45,6 +47,98 @@ except OSError:
 # Define proficiency levels
 PROFICIENCY_LEVELS = ["Beginner", "Intermediate", "Advanced", "Expert"]
 
+SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+
+@functools.lru_cache(maxsize=256)
+def _split_sentences(text):
+    """
+    Split text into sentences on terminal punctuation
+    
+    Results are cached, since the same context or certification text is
+    analyzed for several skills.
+    
+    Args:
+        text (str): The text to split
+        
+    Returns:
+        tuple: The sentences, unstripped
+    """
+    return tuple(SENTENCE_SPLIT_RE.split(text))
+
+def _is_word_boundary(text, index):
+    """
+    Check whether a regex \\b would match at a position in text
+    
+    Args:
+        text (str): The text
+        index (int): Position between text[index - 1] and text[index]
+        
+    Returns:
+        bool: True if exactly one side of the position is a word character
+    """
+    before = index > 0 and (text[index - 1].isalnum() or text[index - 1] == '_')
+    after = index < len(text) and (text[index].isalnum() or text[index] == '_')
+    return before != after
+
+def _term_bounds(line, lower_line, term, whole_word=False):
+    """
+    Find where a term first and last starts on a line, ignoring case
+    
+    ASCII lines are searched with str.find on the lowercased line; anything
+    else falls back to a case-insensitive regex so that matching stays the
+    same as with re.IGNORECASE.
+    
+    Args:
+        line (str): A single line of text
+        lower_line (str): The same line, lowercased
+        term (str): The term to look for
+        whole_word (bool): Whether the term must sit between word boundaries
+        
+    Returns:
+        tuple: (first_start, last_start), or None if the term does not occur
+    """
+    if not (line.isascii() and term.isascii()):
+        pattern = re.escape(term)
+        if whole_word:
+            pattern = r'\b' + pattern + r'\b'
+        starts = [match.start() for match in re.finditer(r'(?=' + pattern + r')', line, re.IGNORECASE)]
+        return (starts[0], starts[-1]) if starts else None
+    
+    term = term.lower()
+    first = lower_line.find(term)
+    if whole_word:
+        while first != -1 and not (_is_word_boundary(lower_line, first)
+                                   and _is_word_boundary(lower_line, first + len(term))):
+            first = lower_line.find(term, first + 1)
+    if first == -1:
+        return None
+    
+    last = lower_line.rfind(term)
+    if whole_word:
+        while not (_is_word_boundary(lower_line, last)
+                   and _is_word_boundary(lower_line, last + len(term))):
+            last = lower_line.rfind(term, 0, last + len(term) - 1)
+    return first, last
+
+def _occur_apart(bounds, length, other_bounds, other_length):
+    """
+    Check whether two terms occur on a line without overlapping
+    
+    This holds exactly when a regex like 'a.*?b|b.*?a' would match the line.
+    
+    Args:
+        bounds (tuple): First and last start of the first term, or None
+        length (int): Length of the first term
+        other_bounds (tuple): First and last start of the second term, or None
+        other_length (int): Length of the second term
+        
+    Returns:
+        bool: True if one term ends at or before the other starts
+    """
+    if bounds is None or other_bounds is None:
+        return False
+    return bounds[0] + length <= other_bounds[1] or other_bounds[0] + other_length <= bounds[1]
+
 class SkillProcessor:
     """
     Class for extracting and processing skills from text.
@@ -432,13 +526,16 @@ class SkillProcessor:
         Returns:
             bool: True if this is not a skill context, False otherwise
         """
+        # Escape the skill name once for all of the patterns below
+        escaped_skill = re.escape(skill_name)
+        
         # Negative contexts that suggest this is not a skill mention
         negative_patterns = [
-            r"not familiar with " + re.escape(skill_name),
-            r"no experience (?:with|in) " + re.escape(skill_name),
-            r"would like to learn " + re.escape(skill_name),
-            r"interested in learning " + re.escape(skill_name),
-            r"plan(?:s|ning)? to learn " + re.escape(skill_name)
+            r"not familiar with " + escaped_skill,
+            r"no experience (?:with|in) " + escaped_skill,
+            r"would like to learn " + escaped_skill,
+            r"interested in learning " + escaped_skill,
+            r"plan(?:s|ning)? to learn " + escaped_skill
         ]
         
         # Check if any negative pattern matches
@@ -449,15 +546,15 @@ class SkillProcessor:
         # For programming languages, check if they're mentioned in education context only
         if skill_name in ["C++", "Java", "Python", "JavaScript"]:
             education_only_patterns = [
-                r"course(?:s|work)? (?:in|on) " + re.escape(skill_name),
-                r"(?:introduction|intro) to " + re.escape(skill_name),
-                r"studied " + re.escape(skill_name)
+                r"course(?:s|work)? (?:in|on) " + escaped_skill,
+                r"(?:introduction|intro) to " + escaped_skill,
+                r"studied " + escaped_skill
             ]
             
             # If it appears in education context, ensure it also appears elsewhere
             education_matches = any(re.search(pattern, context, re.IGNORECASE) for pattern in education_only_patterns)
             
-            if education_matches and not re.search(r"experience (?:with|in|using) " + re.escape(skill_name), context, re.IGNORECASE):
+            if education_matches and not re.search(r"experience (?:with|in|using) " + escaped_skill, context, re.IGNORECASE):
                 return True
                 
         return False
@@ -473,21 +570,24 @@ class SkillProcessor:
         Returns:
             bool: True if this is a strong skill context, False otherwise
         """
+        # Escape the skill name once for all of the patterns below
+        escaped_skill = re.escape(skill_name)
+        
         # Patterns indicating strong skill evidence
         strong_patterns = [
-            r"experience (?:with|in|using) " + re.escape(skill_name),
-            r"proficient (?:in|with) " + re.escape(skill_name),
-            r"knowledge of " + re.escape(skill_name),
-            r"skilled (?:in|with) " + re.escape(skill_name),
-            r"expertise (?:in|with) " + re.escape(skill_name),
-            r"practiced (?:in|with) " + re.escape(skill_name),
-            r"(?:extensive|advanced) " + re.escape(skill_name),
-            r"skills?:.*" + re.escape(skill_name),
-            r"technologies:.*" + re.escape(skill_name),
-            r"technical skills:.*" + re.escape(skill_name),
-            r"languages:.*" + re.escape(skill_name),
-            r"programming:.*" + re.escape(skill_name),
-            r"database:.*" + re.escape(skill_name) 
+            r"experience (?:with|in|using) " + escaped_skill,
+            r"proficient (?:in|with) " + escaped_skill,
+            r"knowledge of " + escaped_skill,
+            r"skilled (?:in|with) " + escaped_skill,
+            r"expertise (?:in|with) " + escaped_skill,
+            r"practiced (?:in|with) " + escaped_skill,
+            r"(?:extensive|advanced) " + escaped_skill,
+            r"skills?:.*" + escaped_skill,
+            r"technologies:.*" + escaped_skill,
+            r"technical skills:.*" + escaped_skill,
+            r"languages:.*" + escaped_skill,
+            r"programming:.*" + escaped_skill,
+            r"database:.*" + escaped_skill 
         ]
         
         # Check if any strong pattern matches
@@ -760,49 +860,52 @@ class SkillProcessor:
         Returns:
             bool: True if in programming context, False otherwise
         """
+        # Escape the skill name once for all of the patterns below
+        escaped_skill = re.escape(skill_name)
+        
         # Define programming context patterns
         programming_patterns = [
-            r'programming\s+languages?.*\b' + re.escape(skill_name) + r'\b',
-            r'software\s+development.*\b' + re.escape(skill_name) + r'\b',
-            r'technical\s+skills?.*\b' + re.escape(skill_name) + r'\b',
-            r'technologies.*\b' + re.escape(skill_name) + r'\b',
-            r'languages.*\b' + re.escape(skill_name) + r'\b',
-            r'proficient\s+in.*\b' + re.escape(skill_name) + r'\b',
-            r'skills.*\b' + re.escape(skill_name) + r'\b',
-            r'\b' + re.escape(skill_name) + r'\b\s+programming',
-            r'\b' + re.escape(skill_name) + r'\b\s+development'
+            r'programming\s+languages?.*\b' + escaped_skill + r'\b',
+            r'software\s+development.*\b' + escaped_skill + r'\b',
+            r'technical\s+skills?.*\b' + escaped_skill + r'\b',
+            r'technologies.*\b' + escaped_skill + r'\b',
+            r'languages.*\b' + escaped_skill + r'\b',
+            r'proficient\s+in.*\b' + escaped_skill + r'\b',
+            r'skills.*\b' + escaped_skill + r'\b',
+            r'\b' + escaped_skill + r'\b\s+programming',
+            r'\b' + escaped_skill + r'\b\s+development'
         ]
         
         # Database-specific context patterns
         database_patterns = [
-            r'database.*\b' + re.escape(skill_name) + r'\b',
-            r'query\s+languages?.*\b' + re.escape(skill_name) + r'\b',
-            r'data\s+technologies.*\b' + re.escape(skill_name) + r'\b',
-            r'data\s+warehousing.*\b' + re.escape(skill_name) + r'\b',
-            r'sql.*\b' + re.escape(skill_name) + r'\b',
-            r'schema.*\b' + re.escape(skill_name) + r'\b',
-            r'data\s+modeling.*\b' + re.escape(skill_name) + r'\b',
-            r'etl.*\b' + re.escape(skill_name) + r'\b'
+            r'database.*\b' + escaped_skill + r'\b',
+            r'query\s+languages?.*\b' + escaped_skill + r'\b',
+            r'data\s+technologies.*\b' + escaped_skill + r'\b',
+            r'data\s+warehousing.*\b' + escaped_skill + r'\b',
+            r'sql.*\b' + escaped_skill + r'\b',
+            r'schema.*\b' + escaped_skill + r'\b',
+            r'data\s+modeling.*\b' + escaped_skill + r'\b',
+            r'etl.*\b' + escaped_skill + r'\b'
         ]
         
         # Teaching and education context patterns
         teaching_patterns = [
-            r'teaching.*\b' + re.escape(skill_name) + r'\b',
-            r'education.*\b' + re.escape(skill_name) + r'\b',
-            r'curriculum.*\b' + re.escape(skill_name) + r'\b',
-            r'instruction.*\b' + re.escape(skill_name) + r'\b',
-            r'classroom.*\b' + re.escape(skill_name) + r'\b',
-            r'learning.*\b' + re.escape(skill_name) + r'\b',
-            r'assessment.*\b' + re.escape(skill_name) + r'\b',
-            r'student.*\b' + re.escape(skill_name) + r'\b'
+            r'teaching.*\b' + escaped_skill + r'\b',
+            r'education.*\b' + escaped_skill + r'\b',
+            r'curriculum.*\b' + escaped_skill + r'\b',
+            r'instruction.*\b' + escaped_skill + r'\b',
+            r'classroom.*\b' + escaped_skill + r'\b',
+            r'learning.*\b' + escaped_skill + r'\b',
+            r'assessment.*\b' + escaped_skill + r'\b',
+            r'student.*\b' + escaped_skill + r'\b'
         ]
         
         # Version control context patterns
         vcs_patterns = [
-            r'version\s+control.*\b' + re.escape(skill_name) + r'\b',
-            r'code\s+management.*\b' + re.escape(skill_name) + r'\b',
-            r'repository.*\b' + re.escape(skill_name) + r'\b',
-            r'git.*\b' + re.escape(skill_name) + r'\b'
+            r'version\s+control.*\b' + escaped_skill + r'\b',
+            r'code\s+management.*\b' + escaped_skill + r'\b',
+            r'repository.*\b' + escaped_skill + r'\b',
+            r'git.*\b' + escaped_skill + r'\b'
         ]
         
         # All patterns to check
@@ -983,6 +1086,34 @@ class ProficiencyCalculator:
             ]
         }
         
+        self._indicator_automaton = self._build_indicator_automaton()
+        
+        # Duration patterns are searched in every sentence, so compile them once
+        self._duration_patterns = {
+            level: [re.compile(pattern) for pattern in patterns]
+            for level, patterns in self.duration_indicators.items()
+        }
+        
+    def _build_indicator_automaton(self):
+        """
+        Build an Aho-Corasick automaton over the lowercased proficiency indicators
+        
+        Returns:
+            ahocorasick.Automaton: Maps each indicator to (indicator, levels), with
+                one level entry per list the indicator appears in
+        """
+        indicator_levels = defaultdict(list)
+        for level, indicators in self.proficiency_indicators.items():
+            for indicator in indicators:
+                indicator_levels[indicator.lower()].append(level)
+                
+        automaton = ahocorasick.Automaton()
+        for indicator, levels in indicator_levels.items():
+            automaton.add_word(indicator, (indicator, tuple(levels)))
+        automaton.make_automaton()
+        
+        return automaton
+        
     def update_for_industry(self, industry):
         """
         Update proficiency indicators for a specific industry
@@ -997,6 +1128,8 @@ class ProficiencyCalculator:
             for level, indicators in self.industry_proficiency_indicators[industry].items():
                 self.proficiency_indicators[level].extend(indicators)
                 logger.info(f"Added {len(indicators)} {industry}-specific {level} indicators")
+                
+            self._indicator_automaton = self._build_indicator_automaton()
         
     def calculate_proficiency(self, skill_name, context, certification_text=None, is_backed=False, confidence_boost=0):
         """
@@ -1015,50 +1148,84 @@ class ProficiencyCalculator:
         # Initialize scores for each proficiency level
         scores = {level: 0 for level in PROFICIENCY_LEVELS}
         
+        # Escape the skill name once for the skill patterns below
+        escaped_skill = re.escape(skill_name)
+        
         # Check if this is a technical or language skill
         is_tech_skill = self.technical_skills and skill_name in self.technical_skills
         is_language = skill_name.lower() in ["python", "java", "javascript", "sql", "c++", "r", "php"]
         
         # Extract sentences mentioning the skill for more precise context analysis
+        skill_re = re.compile(r'\b' + escaped_skill + r'\b', re.IGNORECASE)
         skill_sentences = []
-        for sentence in re.split(r'[.!?]+', context):
-            if re.search(r'\b' + re.escape(skill_name) + r'\b', sentence, re.IGNORECASE):
+        for sentence in _split_sentences(context):
+            if skill_re.search(sentence):
                 skill_sentences.append(sentence.strip())
         
         # If no specific sentences found, use the whole context
         if not skill_sentences:
             skill_sentences = [context]
             
+        # Lowercase each sentence once for all of the checks below
+        sentence_pairs = [(sentence, sentence.lower()) for sentence in skill_sentences]
+            
         # Analyze each sentence for proficiency indicators
-        for sentence in skill_sentences:
-            # Look for proficiency indicators in this specific sentence
-            for level, indicators in self.proficiency_indicators.items():
-                for indicator in indicators:
-                    if re.search(r'\b' + re.escape(indicator) + r'\b', sentence, re.IGNORECASE):
-                        scores[level] += 1
+        for sentence, lower_sentence in sentence_pairs:
+            # Look for proficiency indicators in this specific sentence; each
+            # whole-word indicator counts once per level list it appears in
+            found = {}
+            for end, (indicator, levels) in self._indicator_automaton.iter(lower_sentence):
+                start = end - len(indicator) + 1
+                if (indicator not in found and _is_word_boundary(lower_sentence, start)
+                        and _is_word_boundary(lower_sentence, end + 1)):
+                    found[indicator] = levels
+                    
+            for levels in found.values():
+                for level in levels:
+                    scores[level] += 1
             
             # Look for duration indicators in this specific sentence
-            for level, patterns in self.duration_indicators.items():
+            for level, patterns in self._duration_patterns.items():
                 for pattern in patterns:
-                    if re.search(pattern, sentence, re.IGNORECASE):
+                    if pattern.search(lower_sentence):
                         scores[level] += 2  # Duration is a stronger indicator
             
+            # Locate the skill once per line of this sentence; action verbs
+            # only count on a line that mentions the skill
+            skill_lines = []
+            for line in sentence.split("\n"):
+                lower_line = line.lower()
+                skill_bounds = _term_bounds(line, lower_line, skill_name, whole_word=True)
+                if skill_bounds:
+                    skill_lines.append((line, lower_line, skill_bounds))
+            
             # Look for action verbs in this specific sentence
-            for level, verbs in self.action_verb_indicators.items():
-                for verb in verbs:
-                    # Look for verbs near the skill name
-                    pattern = r'(?i)(?:' + re.escape(verb) + r'.*?\b' + re.escape(skill_name) + r'\b|\b' + re.escape(skill_name) + r'\b.*?' + re.escape(verb) + r')'
-                    if re.search(pattern, sentence, re.IGNORECASE):
-                        scores[level] += 1.5  # Action verbs are strong indicators
+            if skill_lines:
+                for level, verbs in self.action_verb_indicators.items():
+                    for verb in verbs:
+                        # Look for verbs near the skill name, i.e. before or after it on the same line
+                        if any(_occur_apart(_term_bounds(line, lower_line, verb), len(verb), skill_bounds, len(skill_name))
+                               for line, lower_line, skill_bounds in skill_lines):
+                            scores[level] += 1.5  # Action verbs are strong indicators
         
         # If certification text is provided, check for certification indicators
         if certification_text:
-            for level, indicators in self.certification_indicators.items():
-                for indicator in indicators:
-                    # Look for indicators near the skill name in certification text
-                    pattern = r'(?i)(?:' + re.escape(skill_name) + r'.*?\b' + re.escape(indicator) + r'\b|\b' + re.escape(indicator) + r'\b.*?' + re.escape(skill_name) + r')'
-                    if re.search(pattern, certification_text, re.IGNORECASE):
-                        scores[level] += 3  # Certification indicators are strongest
+            # Locate the skill once per line of the certification text
+            cert_lines = []
+            for line in certification_text.split("\n"):
+                lower_line = line.lower()
+                skill_bounds = _term_bounds(line, lower_line, skill_name)
+                if skill_bounds:
+                    cert_lines.append((line, lower_line, skill_bounds))
+            
+            if cert_lines:
+                for level, indicators in self.certification_indicators.items():
+                    for indicator in indicators:
+                        # Look for whole-word indicators near the skill name in certification text
+                        if any(_occur_apart(_term_bounds(line, lower_line, indicator, whole_word=True), len(indicator),
+                                            skill_bounds, len(skill_name))
+                               for line, lower_line, skill_bounds in cert_lines):
+                            scores[level] += 3  # Certification indicators are strongest
         
         # If skill is backed by certification, boost scores appropriately
         if is_backed:
@@ -1088,50 +1255,54 @@ class ProficiencyCalculator:
         # For technical skills, add baseline boost based on context
         if is_tech_skill:
             # Check if skill is mentioned in a key skills section or with strong indicators
-            tech_skill_patterns = [
-                r"technical skills.*" + re.escape(skill_name),
-                r"programming languages.*" + re.escape(skill_name),
-                r"database technologies.*" + re.escape(skill_name),
-                r"development tools.*" + re.escape(skill_name),
-                r"proficient in.*" + re.escape(skill_name)
+            tech_skill_terms = [
+                r"technical skills",
+                r"programming languages",
+                r"database technologies",
+                r"development tools",
+                r"proficient in"
             ]
             
-            if any(re.search(pattern, context, re.IGNORECASE) for pattern in tech_skill_patterns):
+            # A single alternation finds any of the terms ahead of the skill
+            tech_skill_pattern = r"(?:" + "|".join(tech_skill_terms) + r").*" + escaped_skill
+            if re.search(tech_skill_pattern, context, re.IGNORECASE):
                 scores["Intermediate"] += 1.5
         
         # Look for actual work or project experience with the skill
-        experience_patterns = [
-            r"(?:developed|built|created|implemented|designed).*" + re.escape(skill_name),
-            r"project.*" + re.escape(skill_name),
-            r"application.*" + re.escape(skill_name),
-            r"system.*" + re.escape(skill_name),
-            r"production.*" + re.escape(skill_name)
+        experience_terms = [
+            r"(?:developed|built|created|implemented|designed)",
+            r"project",
+            r"application",
+            r"system",
+            r"production"
         ]
         
-        # Add industry-specific experience patterns
+        # Add industry-specific experience terms
         if self.industry == "healthcare":
-            experience_patterns.extend([
-                r"(?:treated|diagnosed|cared for).*" + re.escape(skill_name),
-                r"patient.*" + re.escape(skill_name),
-                r"clinical.*" + re.escape(skill_name),
-                r"medical.*" + re.escape(skill_name)
+            experience_terms.extend([
+                r"(?:treated|diagnosed|cared for)",
+                r"patient",
+                r"clinical",
+                r"medical"
             ])
         elif self.industry == "education":
-            experience_patterns.extend([
-                r"(?:taught|instructed|educated).*" + re.escape(skill_name),
-                r"classroom.*" + re.escape(skill_name),
-                r"student.*" + re.escape(skill_name),
-                r"curriculum.*" + re.escape(skill_name)
+            experience_terms.extend([
+                r"(?:taught|instructed|educated)",
+                r"classroom",
+                r"student",
+                r"curriculum"
             ])
         elif self.industry == "finance":
-            experience_patterns.extend([
-                r"(?:analyzed|prepared|audited).*" + re.escape(skill_name),
-                r"financial.*" + re.escape(skill_name),
-                r"accounting.*" + re.escape(skill_name),
-                r"report.*" + re.escape(skill_name)
+            experience_terms.extend([
+                r"(?:analyzed|prepared|audited)",
+                r"financial",
+                r"accounting",
+                r"report"
             ])
         
-        if any(re.search(pattern, context, re.IGNORECASE) for pattern in experience_patterns):
+        # A single alternation finds any of the terms ahead of the skill
+        experience_pattern = r"(?:" + "|".join(experience_terms) + r").*" + escaped_skill
+        if re.search(experience_pattern, context, re.IGNORECASE):
             # Evidence of actual use boosts Intermediate and Advanced scores
             scores["Intermediate"] += 1
             scores["Advanced"] += 0.5
@@ -1283,6 +1454,35 @@ class DocumentProcessor:
                 "credential" in lower_path or 
                 "diploma" in lower_path)
 
+    def categorize_files(self, file_paths):
+        """
+        Tag each file with its category in a single pass
+        
+        A file that looks like both a resume and a certification is tagged
+        with both categories.
+        
+        Args:
+            file_paths (list): Paths to the files
+            
+        Returns:
+            list: (category, file_path) tuples, where category is one of
+                'resumes', 'certifications' or 'unknown'
+        """
+        tagged_files = []
+        
+        for file_path in file_paths:
+            is_resume = self.is_resume(file_path)
+            is_certification = self.is_certification(file_path)
+            
+            if is_resume:
+                tagged_files.append(('resumes', file_path))
+            if is_certification:
+                tagged_files.append(('certifications', file_path))
+            if not is_resume and not is_certification:
+                tagged_files.append(('unknown', file_path))
+                
+        return tagged_files
+
 
 def parse_arguments():
     """Parse command line arguments"""
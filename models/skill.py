@@ -3,8 +3,8 @@ class Skill:
     Class representing a skill with its attributes
     """
     
-    # Proficiency levels
-    PROFICIENCY_LEVELS = ["Beginner", "Intermediate", "Advanced", "Expert"]
+    # Proficiency levels (frozenset for O(1) membership checks)
+    PROFICIENCY_LEVELS = frozenset(("Beginner", "Intermediate", "Advanced", "Expert"))
     
     def __init__(self, name, proficiency=None, is_backed=False, 
                  confidence_score=0.0, backing_certificate=None, source=None):
@@ -65,8 +65,8 @@ class Skill:
     
     def __str__(self):
         """String representation of the skill"""
-        backed_status = "Backed" if self.is_backed else "Unbacked"
-        certificate_info = f" by {self.backing_certificate}" if self.backing_certificate else ""
-        source_info = f" (from {self.source})" if self.source else ""
-        
-        return f"{self.name}: {self.proficiency or 'Unknown'} ({backed_status}{certificate_info}) - {self.confidence_score:.2f} confidence{source_info}" 
\ No newline at end of file
+        return (f"{self.name}: {self.proficiency or 'Unknown'} "
+                f"({'Backed' if self.is_backed else 'Unbacked'}"
+                f"{f' by {self.backing_certificate}' if self.backing_certificate else ''}) "
+                f"- {self.confidence_score:.2f} confidence"
+                f"{f' (from {self.source})' if self.source else ''}") 
\ No newline at end of file
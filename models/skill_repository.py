@@ -1,7 +1,19 @@
-import json
 import os
+import stat
+import tempfile
+import orjson
+from operator import attrgetter
 from .skill import Skill
 
+# Shared sort key for ordering skills by confidence
+_CONF = attrgetter('confidence_score')
+
+# Mode a plain open() gives new files; the umask can only be read by setting
+# it, so do that once at import rather than on every save
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_NEW_FILE_MODE = 0o666 & ~_UMASK
+
 class SkillRepository:
     """
     Repository for managing skills
@@ -96,7 +108,7 @@ class SkillRepository:
             
         # Sort skills by confidence score within each source
         for source in skills_by_source:
-            skills_by_source[source].sort(key=lambda s: s.confidence_score, reverse=True)
+            skills_by_source[source].sort(key=_CONF, reverse=True)
             
         return skills_by_source
     
@@ -128,8 +140,28 @@ class SkillRepository:
                 'skills': [skill.to_dict() for skill in self.skills.values()]
             }
             
-            with open(file_path, 'w') as f:
-                json.dump(skills_data, f, indent=4)
+            payload = orjson.dumps(skills_data, option=orjson.OPT_INDENT_2)
+            
+            # Write to a temp file in the same directory and rename it over the
+            # destination so readers never see a partially written file
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(file_path) or '.',
+                                            prefix='.skills_', suffix='.json')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(payload)
+                    
+                # mkstemp creates the file as 0600; give it the mode of the file
+                # it replaces, or the mode a plain open() would have used
+                try:
+                    mode = stat.S_IMODE(os.stat(file_path).st_mode)
+                except FileNotFoundError:
+                    mode = _NEW_FILE_MODE
+                os.chmod(tmp_path, mode)
+                
+                os.replace(tmp_path, file_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
                 
             return True
             
@@ -151,21 +183,16 @@ class SkillRepository:
             return False
             
         try:
-            with open(file_path, 'r') as f:
-                skills_data = json.load(f)
+            with open(file_path, 'rb') as f:
+                skills_data = orjson.loads(f.read())
                 
-            self.skills = {}
-            
-            for skill_dict in skills_data.get('skills', []):
-                skill = Skill(
-                    name=skill_dict['name'],
-                    proficiency=skill_dict.get('proficiency'),
-                    is_backed=skill_dict.get('is_backed', False),
-                    confidence_score=skill_dict.get('confidence_score', 0.0),
-                    backing_certificate=skill_dict.get('backing_certificate'),
-                    source=skill_dict.get('source')
-                )
-                self.skills[skill.name] = skill
+            # Build the whole mapping in one pass with positional Skill args
+            self.skills = {
+                d['name']: Skill(d['name'], d.get('proficiency'), d.get('is_backed', False),
+                                 d.get('confidence_score', 0.0), d.get('backing_certificate'),
+                                 d.get('source'))
+                for d in skills_data.get('skills', [])
+            }
                 
             return True
             
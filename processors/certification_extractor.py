@@ -2,18 +2,133 @@ import json
 import re
 import os
 import logging
+import functools
+import hashlib
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
 from datetime import datetime
+import ahocorasick
 import spacy
 
-try:
-    # Try loading the language model for NER
-    nlp = spacy.load("en_core_web_md")
-except OSError:
-    # Fall back to a simpler model if the larger one isn't available
-    nlp = spacy.load("en_core_web_sm")
+@functools.lru_cache(maxsize=1)
+def _get_sent_nlp():
+    """
+    Build the lightweight rule-based pipeline used for sentence splitting
+    
+    Returns:
+        spacy.language.Language: Blank English pipeline with a sentencizer
+    """
+    sent_nlp = spacy.blank("en")
+    sent_nlp.add_pipe("sentencizer")
+    return sent_nlp
+
+# Lead words that make a pattern match a certification statement
+CERT_STATEMENT_KEYWORDS = frozenset(("certified", "certificate", "certification", "qualified", "diploma"))
+
+# Keywords marking a sentence as a certification candidate
+CERT_KEYWORD_RE = re.compile(r'certified|certification|certificate|credential|qualified|diploma', re.IGNORECASE)
+
+# Bounded cache of spaCy sentence splits, keyed by a short digest of the
+# text so repeated blocks across a batch are parsed only once
+_TEXT_CACHE_SIZE = 2048
+_text_cache_lock = threading.Lock()
+_sentence_cache = OrderedDict()
+_CACHE_MISS = object()
+
+def _text_key(text):
+    """Return a compact digest used as a cache key for a text"""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest()
+
+def _cache_get(cache, key):
+    """Look up a cached value, marking it as most recently used"""
+    with _text_cache_lock:
+        if key not in cache:
+            return _CACHE_MISS
+        cache.move_to_end(key)
+        return cache[key]
+
+def _cache_put(cache, key, value):
+    """Store a value, evicting the least recently used entry when full"""
+    with _text_cache_lock:
+        cache[key] = value
+        cache.move_to_end(key)
+        if len(cache) > _TEXT_CACHE_SIZE:
+            cache.popitem(last=False)
     
 logger = logging.getLogger('certification_extractor')
 
+# Certifications and providers used when no database file is available
+DEFAULT_CERT_DB = {
+    "certifications": [
+        "AWS Certified Solutions Architect",
+        "AWS Certified Developer",
+        "AWS Certified SysOps Administrator",
+        "Microsoft Certified: Azure Administrator",
+        "Microsoft Certified: Azure Developer",
+        "Microsoft Certified: Azure Solutions Architect",
+        "Google Cloud Professional Cloud Architect",
+        "Google Cloud Professional Data Engineer",
+        "Cisco Certified Network Associate (CCNA)",
+        "Cisco Certified Network Professional (CCNP)",
+        "CompTIA A+",
+        "CompTIA Network+",
+        "CompTIA Security+",
+        "Certified Information Systems Security Professional (CISSP)",
+        "Project Management Professional (PMP)",
+        "Certified ScrumMaster (CSM)",
+        "Professional Scrum Master (PSM)",
+        "Oracle Certified Associate (OCA)",
+        "Oracle Certified Professional (OCP)",
+        "MySQL Certified Developer",
+        "MongoDB Certified Developer",
+        "Certified Kubernetes Administrator (CKA)",
+        "Certified Kubernetes Application Developer (CKAD)",
+        "Certified Ethical Hacker (CEH)",
+        "Offensive Security Certified Professional (OSCP)",
+        "Salesforce Certified Administrator",
+        "Salesforce Certified Developer",
+        "Certified Information Security Manager (CISM)",
+        "ITIL Foundation",
+        "TOGAF Certified"
+    ],
+    "providers": [
+        "AWS",
+        "Microsoft",
+        "Google Cloud",
+        "Cisco",
+        "CompTIA",
+        "PMI",
+        "Scrum Alliance",
+        "Scrum.org",
+        "Oracle",
+        "MySQL",
+        "MongoDB",
+        "Linux Foundation",
+        "EC-Council",
+        "Offensive Security",
+        "Salesforce",
+        "ISACA",
+        "Axelos",
+        "The Open Group"
+    ]
+}
+
+@functools.lru_cache(maxsize=8)
+def _load_cert_db_file(path, mtime):
+    """
+    Parse a certifications database file, cached per (path, mtime)
+    
+    Args:
+        path (str): Path to the certifications database JSON file
+        mtime (float): Modification time of the file, part of the cache key
+        
+    Returns:
+        dict: Certification data
+    """
+    with open(path, 'rb') as f:
+        return json.load(f)
+    
 class CertificationExtractor:
     """
     Certification extractor that works with structured document formats
@@ -32,9 +147,29 @@ class CertificationExtractor:
         self.certification_providers = self.cert_data.get("providers", [])
         
         # Common certification patterns and variations
-        self.cert_patterns = self._compile_cert_patterns()
+        self._union_re = self._compile_cert_patterns()
+        self.cert_doc_patterns = self._compile_cert_doc_patterns()
+        
+        # Cheap prefilter: every certification pattern needs one of these stems
+        self._fast_gate = re.compile(r'certif|credenti|qualif|diplom', re.IGNORECASE)
+        
+        # Whitespace normalisation and filename splitting patterns
+        self._ws_re = re.compile(r'\s+')
+        self._fn_split_re = re.compile(r'[-_\s]')
         self.skill_to_cert_map = self._build_skill_cert_map()
         
+        # Single automaton over all known certifications, scanned once per text
+        self._cert_automaton = self._build_cert_automaton()
+        
+        # Lowercased lookups precomputed once instead of inside the hot loops
+        self._providers_by_lower = {}
+        for index, provider in enumerate(self.certification_providers):
+            self._providers_by_lower.setdefault(provider.lower(), (index, provider))
+        self._skill_cert_map_l = {
+            skill_key.lower(): [pattern.lower() for pattern in cert_patterns]
+            for skill_key, cert_patterns in self.skill_to_cert_map.items()
+        }
+        
     def _load_cert_data(self, certifications_db_path):
         """
         Load certification data from a JSON file
@@ -45,96 +180,186 @@ class CertificationExtractor:
         Returns:
             dict: Certification data
         """
-        default_db = {
-            "certifications": [
-                "AWS Certified Solutions Architect",
-                "AWS Certified Developer",
-                "AWS Certified SysOps Administrator",
-                "Microsoft Certified: Azure Administrator",
-                "Microsoft Certified: Azure Developer",
-                "Microsoft Certified: Azure Solutions Architect",
-                "Google Cloud Professional Cloud Architect",
-                "Google Cloud Professional Data Engineer",
-                "Cisco Certified Network Associate (CCNA)",
-                "Cisco Certified Network Professional (CCNP)",
-                "CompTIA A+",
-                "CompTIA Network+",
-                "CompTIA Security+",
-                "Certified Information Systems Security Professional (CISSP)",
-                "Project Management Professional (PMP)",
-                "Certified ScrumMaster (CSM)",
-                "Professional Scrum Master (PSM)",
-                "Oracle Certified Associate (OCA)",
-                "Oracle Certified Professional (OCP)",
-                "MySQL Certified Developer",
-                "MongoDB Certified Developer",
-                "Certified Kubernetes Administrator (CKA)",
-                "Certified Kubernetes Application Developer (CKAD)",
-                "Certified Ethical Hacker (CEH)",
-                "Offensive Security Certified Professional (OSCP)",
-                "Salesforce Certified Administrator",
-                "Salesforce Certified Developer",
-                "Certified Information Security Manager (CISM)",
-                "ITIL Foundation",
-                "TOGAF Certified"
-            ],
-            "providers": [
-                "AWS",
-                "Microsoft",
-                "Google Cloud",
-                "Cisco",
-                "CompTIA",
-                "PMI",
-                "Scrum Alliance",
-                "Scrum.org",
-                "Oracle",
-                "MySQL",
-                "MongoDB",
-                "Linux Foundation",
-                "EC-Council",
-                "Offensive Security",
-                "Salesforce",
-                "ISACA",
-                "Axelos",
-                "The Open Group"
-            ]
-        }
-        
         if not certifications_db_path or not os.path.exists(certifications_db_path):
             logger.warning("Certifications database not provided or not found. Using default certifications list.")
-            return default_db
+            return DEFAULT_CERT_DB
             
         try:
-            with open(certifications_db_path, 'r') as f:
-                return json.load(f)
+            # Keyed by modification time so on-disk edits invalidate the cache
+            return _load_cert_db_file(certifications_db_path, os.path.getmtime(certifications_db_path))
         except Exception as e:
             logger.error(f"Error loading certifications database: {str(e)}")
-            return default_db
+            return DEFAULT_CERT_DB
             
     def _compile_cert_patterns(self):
         """
-        Compile patterns for certification detection
+        Compile patterns for certification detection into one union pattern
+        
+        Each alternative captures a lead group and a value group named
+        <alternative>_lead and <alternative>_value, and ends with an empty
+        group named after itself so match.lastgroup identifies it.
         
         Returns:
-            list: List of compiled patterns
+            re.Pattern: Compiled union pattern
         """
-        patterns = []
+        alternatives = [
+            # Certification statements
+            ("cert_stmt", r'(?P<cert_stmt_lead>certified|certificate|certification|qualified|diploma)\s+(?:in|for|as)?\s+(?P<cert_stmt_value>[^.,:;]+)')
+        ]
         
-        # Pattern for certification statements
-        patterns.append(re.compile(r'(certified|certificate|certification|qualified|diploma)\s+(?:in|for|as)?\s+([^.,:;]+)', re.IGNORECASE))
+        # Provider-specific certifications, with all providers in one
+        # alternation (longest first so e.g. "Google Cloud" wins over a prefix)
+        if self.certification_providers:
+            providers = '|'.join(re.escape(provider) for provider in
+                                 sorted(self.certification_providers, key=len, reverse=True))
+            alternatives.append(("prov_cert", fr'(?:{providers})\s+(?P<prov_cert_lead>certified|certificate|certification)\s+(?P<prov_cert_value>[^.,:;]+)'))
+            alternatives.append(("prov_cert_suffix", fr'(?:{providers})[:\s]+(?P<prov_cert_suffix_lead>certified|certificate|certification|qualified|diploma)\s+(?P<prov_cert_suffix_value>certified|certificate|certification)'))
         
-        # Pattern for provider-specific certifications
-        for provider in self.certification_providers:
-            patterns.append(re.compile(fr'{re.escape(provider)}\s+(certified|certificate|certification)\s+([^.,:;]+)', re.IGNORECASE))
-            patterns.append(re.compile(fr'{re.escape(provider)}[:\s]+([^.,:;]+)\s+(certified|certificate|certification)', re.IGNORECASE))
+        # Certificate numbers/IDs
+        alternatives.append(("cred_id", r'(?P<cred_id_lead>certificate|certification)\s+(?P<cred_id_value>id|number)[:\s]*(?:[A-Za-z0-9\-]+)'))
         
-        # Pattern for certificate numbers/IDs
-        patterns.append(re.compile(r'(certificate|certification|credential)\s+(id|number)[:\s]*([A-Za-z0-9\-]+)', re.IGNORECASE))
+        return re.compile('|'.join(f'{pattern}(?P<{name}>)' for name, pattern in alternatives), re.IGNORECASE)
         
-        # Pattern for issue dates
-        patterns.append(re.compile(r'(issued|issued on|date issued|issue date)[:\s]*(\d{1,2}[/\-\.]\d{1,2}[/\-\.]\d{2,4})', re.IGNORECASE))
+    def _match_cert_statements(self, text):
+        """
+        Find certification names stated in a text using the union pattern
         
-        return patterns
+        Args:
+            text (str): Text to scan
+            
+        Returns:
+            list: Cleaned certification names, in text order
+        """
+        cert_names = []
+        
+        # One pass over the text, dispatching each match on its alternative
+        for match in self._union_re.finditer(text):
+            name = match.lastgroup
+            
+            # Handle certification statements
+            if match.group(f'{name}_lead').lower() in CERT_STATEMENT_KEYWORDS:
+                # Clean up the certification name
+                cert_name = self._ws_re.sub(' ', match.group(f'{name}_value').strip()).strip()
+                if cert_name:
+                    cert_names.append(cert_name)
+                    
+        return cert_names
+        
+    def _compile_cert_doc_patterns(self):
+        """
+        Compile patterns for certification document fields
+        
+        Returns:
+            dict: Compiled patterns per field, in priority order
+        """
+        flags = re.IGNORECASE
+        return {
+            "name": [
+                re.compile(r'certificate\s+(?:of|in|for)\s+([^.,:;]+)', flags),
+                re.compile(r'certification\s+(?:of|in|for)\s+([^.,:;]+)', flags),
+                re.compile(r'certified\s+(?:as|in)\s+([^.,:;]+)', flags),
+                re.compile(r'this certifies that.*completed\s+([^.,:;]+)', flags),
+                re.compile(r'successfully completed\s+([^.,:;]+)', flags)
+            ],
+            # Each field fuses its alternatives, in priority order, into one
+            # pattern (see _fuse_by_priority and _search_by_priority)
+            "issue_date": [
+                self._fuse_by_priority(
+                    r'(?:issue|issuance|issued|completion)\s+date\s*[:\-]?\s*(\d{1,2}[/\-\.]\d{1,2}[/\-\.]\d{2,4})',
+                    r'date\s+(?:issued|of issuance|of completion)\s*[:\-]?\s*(\d{1,2}[/\-\.]\d{1,2}[/\-\.]\d{2,4})',
+                    r'(?:valid|issued)\s+(?:from|on)\s*[:\-]?\s*(\d{1,2}[/\-\.]\d{1,2}[/\-\.]\d{2,4})'),
+                # Bare date as a last resort, only when no labelled date exists
+                self._fuse_by_priority(r'(\d{1,2}[/\-\.]\d{1,2}[/\-\.]\d{2,4})')
+            ],
+            "credential_id": [
+                self._fuse_by_priority(
+                    r'(?:credential|certificate|certification)\s+(?:id|number)\s*[:\-]?\s*([A-Za-z0-9\-]+)',
+                    r'(?:id|number)\s*[:\-]?\s*([A-Za-z0-9\-]+)',
+                    r'verification\s+code\s*[:\-]?\s*([A-Za-z0-9\-]+)')
+            ],
+            "issuing_organization": [
+                self._fuse_by_priority(
+                    r'(?:issued|provided|authorized)\s+by\s+([^.,:;]+)',
+                    r'(?:issuing|certifying)\s+(?:organization|authority|body)\s*[:\-]?\s*([^.,:;]+)',
+                    r'([^.,:;]+)\s+(?:certifies|hereby certifies|confirms)')
+            ]
+        }
+        
+    def _fuse_by_priority(self, *alternatives):
+        """
+        Fuse patterns that each capture one value into a single pattern
+        
+        The alternatives are wrapped in a zero-width lookahead so matches may
+        overlap, and each one captures into a group named after its priority
+        (p0 first), letting _search_by_priority reproduce trying them in order.
+        
+        Args:
+            *alternatives (str): Patterns with one capturing group, highest priority first
+            
+        Returns:
+            re.Pattern: Compiled fused pattern
+        """
+        named = [re.sub(r'(?<!\\)\((?!\?)', f'(?P<p{rank}>', alternative, count=1)
+                 for rank, alternative in enumerate(alternatives)]
+        return re.compile('(?=' + '|'.join(named) + ')', re.IGNORECASE)
+        
+    def _search_by_priority(self, pattern, text):
+        """
+        Scan a text once with a fused pattern and return the value captured by
+        its highest-priority alternative, taking the earliest match on ties
+        
+        Args:
+            pattern (re.Pattern): Pattern whose alternatives capture into p0, p1, ...
+            text (str): Text to scan
+            
+        Returns:
+            str or None: Captured value or None if nothing matched
+        """
+        best_rank = None
+        best_value = None
+        
+        for match in pattern.finditer(text):
+            rank = int(match.lastgroup[1:])
+            if best_rank is None or rank < best_rank:
+                best_rank = rank
+                best_value = match.group(match.lastgroup)
+                if rank == 0:
+                    break
+                    
+        return best_value
+        
+    def _build_cert_automaton(self):
+        """
+        Build an Aho-Corasick automaton over the lowercased known certifications
+        
+        Returns:
+            ahocorasick.Automaton: Automaton yielding (index, certification) values
+        """
+        automaton = ahocorasick.Automaton()
+        
+        for index, cert in enumerate(self.known_certifications):
+            automaton.add_word(cert.lower(), (index, cert))
+            
+        if len(automaton):
+            automaton.make_automaton()
+            
+        return automaton
+        
+    def _find_known_certifications(self, text):
+        """
+        Find the known certifications mentioned in a text
+        
+        Args:
+            text (str): Text to scan
+            
+        Returns:
+            list: Matched certification names, in known-certifications order
+        """
+        if self._cert_automaton.kind != ahocorasick.AHOCORASICK:
+            return []
+            
+        hits = {value for _, value in self._cert_automaton.iter(text.lower())}
+        return [cert for _, cert in sorted(hits)]
         
     def _build_skill_cert_map(self):
         """
@@ -173,6 +398,9 @@ class CertificationExtractor:
         """
         extracted_certs = []
         
+        # Free-text blocks to run through spaCy, as (text, source) tuples
+        text_blocks = []
+        
         # Process based on document type
         doc_type = structured_doc.get("document_type", "unknown")
         
@@ -205,15 +433,44 @@ class CertificationExtractor:
                         if heading["page"] == page["number"]:
                             heading_text = heading["text"]
                             if "certif" in heading_text.lower() or "credential" in heading_text.lower():
-                                # Extract certifications from the heading and nearby content
-                                page_text = page["text"]
-                                heading_certs = self._extract_from_text(page_text, "heading_context")
-                                extracted_certs.extend(heading_certs)
+                                # Extract certifications from the heading and nearby content,
+                                # once per page however many such headings it has
+                                text_blocks.append((page["text"], "heading_context"))
+                                break
         
-        # Use raw text as fallback
+        # Use raw text as fallback, minus the pages already parsed above so
+        # their text isn't split and matched a second time
         if "raw_text" in structured_doc:
-            raw_text_certs = self._extract_from_text(structured_doc["raw_text"], "raw_text")
-            extracted_certs.extend(raw_text_certs)
+            raw_text = structured_doc["raw_text"]
+            for page_text, _ in text_blocks:
+                if page_text:
+                    raw_text = raw_text.replace(page_text, "\n", 1)
+            text_blocks.append((raw_text, "raw_text"))
+            
+        # Split the free-text blocks into candidate sentences, parsing only
+        # the blocks not already cached in a single batched call
+        text_blocks = [(text, source) for text, source in text_blocks if text and text.strip()]
+        block_sentences = []
+        to_parse = {}
+        
+        for text, _ in text_blocks:
+            key = _text_key(text)
+            sentences = _cache_get(_sentence_cache, key)
+            if sentences is _CACHE_MISS and key not in to_parse:
+                to_parse[key] = text
+            block_sentences.append((key, sentences))
+            
+        if to_parse:
+            docs = _get_sent_nlp().pipe(to_parse.values(), batch_size=32)
+            for key, doc in zip(to_parse, docs):
+                parsed = [sent.text for sent in doc.sents if CERT_KEYWORD_RE.search(sent.text)]
+                _cache_put(_sentence_cache, key, parsed)
+                to_parse[key] = parsed
+                
+        for (key, sentences), (_, source) in zip(block_sentences, text_blocks):
+            if sentences is _CACHE_MISS:
+                sentences = to_parse[key]
+            extracted_certs.extend(self._extract_from_text(sentences, source))
         
         # Use metadata from document filename
         if "metadata" in structured_doc and "filename" in structured_doc["metadata"]:
@@ -221,20 +478,22 @@ class CertificationExtractor:
             if "certification" in filename.lower() or "certificate" in filename.lower() or "credential" in filename.lower():
                 # Try to extract certification name from filename
                 filename_no_ext = os.path.splitext(filename)[0]
-                name_parts = re.split(r'[-_\s]', filename_no_ext)
+                name_parts = {part.lower() for part in self._fn_split_re.split(filename_no_ext)}
+                
+                # Providers named in the filename, in provider-list order
+                hits = sorted(self._providers_by_lower[part] for part in name_parts & self._providers_by_lower.keys())
                 
-                for provider in self.certification_providers:
-                    if provider.lower() in [part.lower() for part in name_parts]:
-                        # Found a provider name in the filename
-                        extracted_certs.append({
-                            "name": filename_no_ext.replace('_', ' ').replace('-', ' '),
-                            "confidence": 0.8,
-                            "provider": provider,
-                            "source": "filename",
-                            "metadata": {
-                                "extracted_from": "filename"
-                            }
-                        })
+                for _, provider in hits:
+                    # Found a provider name in the filename
+                    extracted_certs.append({
+                        "name": filename_no_ext.replace('_', ' ').replace('-', ' '),
+                        "confidence": 0.8,
+                        "provider": provider,
+                        "source": "filename",
+                        "metadata": {
+                            "extracted_from": "filename"
+                        }
+                    })
         
         # Deduplicate certifications
         deduplicated_certs = self._deduplicate_certifications(extracted_certs)
@@ -279,16 +538,8 @@ class CertificationExtractor:
             raw_text = structured_doc["raw_text"]
             
             # Look for certificate name patterns
-            name_patterns = [
-                r'certificate\s+(?:of|in|for)\s+([^.,:;]+)',
-                r'certification\s+(?:of|in|for)\s+([^.,:;]+)',
-                r'certified\s+(?:as|in)\s+([^.,:;]+)',
-                r'this certifies that.*completed\s+([^.,:;]+)',
-                r'successfully completed\s+([^.,:;]+)'
-            ]
-            
-            for pattern in name_patterns:
-                matches = re.search(pattern, raw_text, re.IGNORECASE)
+            for pattern in self.cert_doc_patterns["name"]:
+                matches = pattern.search(raw_text)
                 if matches:
                     cert_info["name"] = matches.group(1).strip()
                     break
@@ -298,7 +549,7 @@ class CertificationExtractor:
             # Clean up filename to create a reasonable cert name
             clean_name = os.path.splitext(filename)[0]
             clean_name = clean_name.replace('_', ' ').replace('-', ' ')
-            clean_name = re.sub(r'\s+', ' ', clean_name).strip()
+            clean_name = self._ws_re.sub(' ', clean_name).strip()
             
             # Check if it has typical certification terms
             if not any(term in clean_name.lower() for term in ['certificate', 'certification', 'credential']):
@@ -310,45 +561,13 @@ class CertificationExtractor:
         if "raw_text" in structured_doc:
             raw_text = structured_doc["raw_text"]
             
-            # Look for dates
-            date_patterns = [
-                r'(?:issue|issuance|issued|completion)\s+date\s*[:\-]?\s*(\d{1,2}[/\-\.]\d{1,2}[/\-\.]\d{2,4})',
-                r'date\s+(?:issued|of issuance|of completion)\s*[:\-]?\s*(\d{1,2}[/\-\.]\d{1,2}[/\-\.]\d{2,4})',
-                r'(?:valid|issued)\s+(?:from|on)\s*[:\-]?\s*(\d{1,2}[/\-\.]\d{1,2}[/\-\.]\d{2,4})',
-                r'(\d{1,2}[/\-\.]\d{1,2}[/\-\.]\d{2,4})'
-            ]
-            
-            for pattern in date_patterns:
-                matches = re.search(pattern, raw_text, re.IGNORECASE)
-                if matches:
-                    cert_info["metadata"]["issue_date"] = matches.group(1)
-                    break
-                    
-            # Look for credential ID
-            id_patterns = [
-                r'(?:credential|certificate|certification)\s+(?:id|number)\s*[:\-]?\s*([A-Za-z0-9\-]+)',
-                r'(?:id|number)\s*[:\-]?\s*([A-Za-z0-9\-]+)',
-                r'verification\s+code\s*[:\-]?\s*([A-Za-z0-9\-]+)'
-            ]
-            
-            for pattern in id_patterns:
-                matches = re.search(pattern, raw_text, re.IGNORECASE)
-                if matches:
-                    cert_info["metadata"]["credential_id"] = matches.group(1)
-                    break
-                    
-            # Look for issuing organization
-            org_patterns = [
-                r'(?:issued|provided|authorized)\s+by\s+([^.,:;]+)',
-                r'(?:issuing|certifying)\s+(?:organization|authority|body)\s*[:\-]?\s*([^.,:;]+)',
-                r'([^.,:;]+)\s+(?:certifies|hereby certifies|confirms)'
-            ]
-            
-            for pattern in org_patterns:
-                matches = re.search(pattern, raw_text, re.IGNORECASE)
-                if matches:
-                    cert_info["metadata"]["issuing_organization"] = matches.group(1).strip()
-                    break
+            # Look for dates, credential ID and issuing organization
+            for field in ("issue_date", "credential_id", "issuing_organization"):
+                for pattern in self.cert_doc_patterns[field]:
+                    value = self._search_by_priority(pattern, raw_text)
+                    if value:
+                        cert_info["metadata"][field] = value.strip()
+                        break
         
         # Add to results
         certifications.append(cert_info)
@@ -375,72 +594,43 @@ class CertificationExtractor:
                 continue
                 
             # Check for known certifications
-            for cert in self.known_certifications:
-                if cert.lower() in clean_line.lower():
-                    # Found a known certification
-                    extracted_certs.append({
-                        "name": cert,
-                        "confidence": 0.9,  # High confidence for known certs
-                        "source": source,
-                        "metadata": {
-                            "extracted_from": source,
-                            "context": clean_line
-                        }
-                    })
-                    continue
+            for cert in self._find_known_certifications(clean_line):
+                # Found a known certification
+                extracted_certs.append({
+                    "name": cert,
+                    "confidence": 0.9,  # High confidence for known certs
+                    "source": source,
+                    "metadata": {
+                        "extracted_from": source,
+                        "context": clean_line
+                    }
+                })
                     
+            # Skip the pattern battery for lines without any certification keyword
+            if not self._fast_gate.search(clean_line):
+                continue
+                
             # Check for certification patterns
-            for pattern in self.cert_patterns:
-                matches = pattern.search(clean_line)
-                if matches:
-                    groups = matches.groups()
-                    
-                    if len(groups) >= 2:
-                        # Handle certification statements
-                        if groups[0].lower() in ['certified', 'certificate', 'certification', 'qualified', 'diploma']:
-                            cert_name = groups[1].strip()
-                            
-                            # Clean up the certification name
-                            cert_name = re.sub(r'\s+', ' ', cert_name)
-                            cert_name = cert_name.strip()
-                            
-                            if cert_name:
-                                extracted_certs.append({
-                                    "name": cert_name,
-                                    "confidence": 0.8,
-                                    "source": source,
-                                    "metadata": {
-                                        "extracted_from": source,
-                                        "pattern_matched": "certification_statement",
-                                        "context": clean_line
-                                    }
-                                })
-                                
-                    elif len(groups) >= 1:
-                        # Handle certification ID patterns
-                        if "id" in clean_line.lower() or "number" in clean_line.lower():
-                            # This is likely a credential ID, look for the cert name nearby
-                            cert_name = self._extract_cert_name_from_context(clean_line)
-                            if cert_name:
-                                extracted_certs.append({
-                                    "name": cert_name,
-                                    "confidence": 0.7,
-                                    "source": source,
-                                    "metadata": {
-                                        "extracted_from": source,
-                                        "credential_id": groups[0],
-                                        "context": clean_line
-                                    }
-                                })
+            for cert_name in self._match_cert_statements(clean_line):
+                extracted_certs.append({
+                    "name": cert_name,
+                    "confidence": 0.8,
+                    "source": source,
+                    "metadata": {
+                        "extracted_from": source,
+                        "pattern_matched": "certification_statement",
+                        "context": clean_line
+                    }
+                })
         
         return extracted_certs
         
-    def _extract_from_text(self, text, source):
+    def _extract_from_text(self, sentences, source):
         """
         Extract certifications from text
         
         Args:
-            text (str): Text to analyze
+            sentences (list): Sentences of the text containing certification keywords
             source (str): Source name
             
         Returns:
@@ -448,98 +638,35 @@ class CertificationExtractor:
         """
         extracted_certs = []
         
-        # Skip if text is empty
-        if not text or not text.strip():
-            return extracted_certs
-            
-        # Process with spaCy for context-aware extraction
-        doc = nlp(text)
-        
-        # Look for sentences containing certification keywords
-        cert_keywords = ["certified", "certification", "certificate", "credential", "qualified", "diploma"]
-        
-        for sent in doc.sents:
-            sent_text = sent.text.lower()
-            
-            # Skip if sentence doesn't contain certification keywords
-            if not any(keyword in sent_text for keyword in cert_keywords):
-                continue
-                
+        for sent_text in sentences:
             # Check for known certifications
-            for cert in self.known_certifications:
-                if cert.lower() in sent_text:
-                    # Found a known certification
-                    extracted_certs.append({
-                        "name": cert,
-                        "confidence": 0.85,
-                        "source": source,
-                        "metadata": {
-                            "extracted_from": source,
-                            "context": sent.text
-                        }
-                    })
-                    continue
+            for cert in self._find_known_certifications(sent_text):
+                # Found a known certification
+                extracted_certs.append({
+                    "name": cert,
+                    "confidence": 0.85,
+                    "source": source,
+                    "metadata": {
+                        "extracted_from": source,
+                        "context": sent_text
+                    }
+                })
                     
             # Check for certification patterns
-            for pattern in self.cert_patterns:
-                matches = pattern.search(sent.text)
-                if matches:
-                    groups = matches.groups()
-                    
-                    if len(groups) >= 2:
-                        # Handle certification statements
-                        if groups[0].lower() in ['certified', 'certificate', 'certification', 'qualified', 'diploma']:
-                            cert_name = groups[1].strip()
-                            
-                            # Clean up the certification name
-                            cert_name = re.sub(r'\s+', ' ', cert_name)
-                            cert_name = cert_name.strip()
-                            
-                            if cert_name:
-                                extracted_certs.append({
-                                    "name": cert_name,
-                                    "confidence": 0.75,
-                                    "source": source,
-                                    "metadata": {
-                                        "extracted_from": source,
-                                        "pattern_matched": "certification_statement",
-                                        "context": sent.text
-                                    }
-                                })
+            for cert_name in self._match_cert_statements(sent_text):
+                extracted_certs.append({
+                    "name": cert_name,
+                    "confidence": 0.75,
+                    "source": source,
+                    "metadata": {
+                        "extracted_from": source,
+                        "pattern_matched": "certification_statement",
+                        "context": sent_text
+                    }
+                })
         
         return extracted_certs
         
-    def _extract_cert_name_from_context(self, context):
-        """
-        Extract certification name from context
-        
-        Args:
-            context (str): Context text
-            
-        Returns:
-            str or None: Extracted certification name or None
-        """
-        # Process with spaCy
-        doc = nlp(context)
-        
-        # Look for noun phrases that might be certification names
-        for chunk in doc.noun_chunks:
-            # Skip short chunks
-            if len(chunk.text) < 3:
-                continue
-                
-            # Check if chunk contains certification keywords
-            chunk_text = chunk.text.lower()
-            if any(keyword in chunk_text for keyword in ['certification', 'certificate', 'certified', 'credential']):
-                # Clean up the chunk text
-                clean_chunk = re.sub(r'\s+', ' ', chunk.text)
-                clean_chunk = clean_chunk.strip()
-                
-                return clean_chunk
-                
-        # No suitable certification name found
-        return None
-        
     def _deduplicate_certifications(self, certifications):
         """
         Deduplicate certifications while preserving the highest confidence and metadata
@@ -550,26 +677,17 @@ class CertificationExtractor:
         Returns:
             list: Deduplicated certifications
         """
-        cert_map = {}
+        best = {}
         
         for cert in certifications:
-            cert_name = cert["name"].lower()
-            confidence = cert["confidence"]
+            key = cert["name"].casefold()
+            prev = best.get(key)
             
-            if cert_name not in cert_map or confidence > cert_map[cert_name]["confidence"]:
-                # Create a clean copy with the original name (not lowercase)
-                cert_map[cert_name] = {
-                    "name": cert["name"],  # Keep original capitalization
-                    "confidence": confidence,
-                    "source": cert["source"],
-                    "metadata": cert.get("metadata", {})
-                }
+            # Keep the highest-confidence entry as-is; no per-field copy needed
+            if prev is None or cert["confidence"] > prev["confidence"]:
+                best[key] = cert
                 
-                # Copy other fields if present
-                if "provider" in cert:
-                    cert_map[cert_name]["provider"] = cert["provider"]
-                    
-        return list(cert_map.values())
+        return list(best.values())
         
     def link_skills_to_certifications(self, skills, certifications):
         """
@@ -584,46 +702,57 @@ class CertificationExtractor:
         """
         updated_skills = []
         
+        # All certification names in one NUL-separated string, so a skill can
+        # be located with a single str.find and mapped back to its cert
+        cert_names = [cert["name"].lower() for cert in certifications]
+        joined_names = "\0".join(cert_names)
+        name_starts = []
+        offset = 0
+        for cert_name in cert_names:
+            name_starts.append(offset)
+            offset += len(cert_name) + 1
+            
+        # The certification backing each skill-map key doesn't depend on the
+        # skill, so resolve it at most once per call
+        key_certs = {}
+        
         for skill in skills:
             skill_name = skill["name"].lower()
-            skill_linked = False
+            matched_cert = None
             
-            # Check if the skill matches any certification directly
-            for cert in certifications:
-                cert_name = cert["name"].lower()
+            # Check if the skill matches any certification directly, i.e. the
+            # skill name is in a certification name
+            position = joined_names.find(skill_name) if certifications and "\0" not in skill_name else -1
+            if position != -1:
+                matched_cert = certifications[bisect_right(name_starts, position) - 1]
+                confidence_floor = 0.8
                 
-                # Check if skill name is in certification name
-                if skill_name in cert_name:
-                    updated_skill = skill.copy()
-                    updated_skill["is_backed"] = True
-                    updated_skill["backing_certificate"] = cert["name"]
-                    updated_skill["confidence_score"] = max(skill["confidence_score"], 0.8)  # Increase confidence
-                    updated_skills.append(updated_skill)
-                    skill_linked = True
-                    break
-                    
             # Check skill-cert map if not directly linked
-            if not skill_linked:
-                for skill_key, cert_patterns in self.skill_cert_map.items():
+            else:
+                for skill_key, cert_patterns in self._skill_cert_map_l.items():
                     if skill_key in skill_name or skill_name in skill_key:
-                        # Find matching certifications
-                        for cert in certifications:
-                            cert_name = cert["name"].lower()
-                            
-                            if any(pattern.lower() in cert_name for pattern in cert_patterns):
-                                updated_skill = skill.copy()
-                                updated_skill["is_backed"] = True
-                                updated_skill["backing_certificate"] = cert["name"]
-                                updated_skill["confidence_score"] = max(skill["confidence_score"], 0.75)  # Increase confidence
-                                updated_skills.append(updated_skill)
-                                skill_linked = True
-                                break
-                                
-                    if skill_linked:
-                        break
+                        # Find the first certification matching any pattern for this key
+                        if skill_key not in key_certs:
+                            key_certs[skill_key] = next(
+                                (cert for cert, cert_name in zip(certifications, cert_names)
+                                 if any(pattern in cert_name for pattern in cert_patterns)),
+                                None)
+                        matched_cert = key_certs[skill_key]
                         
-            # Keep original skill if not linked
-            if not skill_linked:
+                        if matched_cert is not None:
+                            confidence_floor = 0.75
+                            break
+                            
+            if matched_cert is None:
+                # Keep original skill if not linked
                 updated_skills.append(skill)
+            else:
+                # Build the linked skill in one shot with increased confidence
+                updated_skills.append({
+                    **skill,
+                    "is_backed": True,
+                    "backing_certificate": matched_cert["name"],
+                    "confidence_score": max(skill["confidence_score"], confidence_floor)
+                })
                 
         return updated_skills 
\ No newline at end of file
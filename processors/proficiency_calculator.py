@@ -1,13 +1,249 @@
 import re
 import logging
 import math
-import nltk  # Add explicit import for nltk
-from collections import defaultdict
-from nltk.tokenize import sent_tokenize
+import functools
+import ahocorasick
+from collections import Counter, defaultdict
 from models.skill import Skill
 
 logger = logging.getLogger('proficiency_calculator')
 
+# Proficiency levels based on Dreyfus & Dreyfus Model (1980, 1986)
+# and Bloom's Taxonomy of Educational Objectives (1956, revised 2001)
+PROFICIENCY_LEVELS = (
+    "Beginner",        # Novice level - rule-based behavior, limited situational perception
+    "Intermediate",    # Advanced beginner - situational perception still limited
+    "Advanced",        # Competent - sees actions as part of broader goals
+    "Expert"           # Proficient/Expert - intuitive grasp of situations, analytical approaches
+)
+
+# Keywords indicating different proficiency levels (based on research by Chi et al., 2014;
+# Ericsson et al., 1993; Simon & Chase, 1973 on expertise development)
+PROFICIENCY_INDICATORS = {
+    # Beginner level keywords (rule-following, assisted work)
+    "Beginner": (
+        "basic", "familiar", "learning", "entry-level", "fundamental", "coursework", 
+        "introduction", "beginner", "novice", "studied", "exposure to", "classroom",
+        "training", "guided", "assisted", "supervised", "academic", "course", "101",
+        "recently", "new to"
+    ),
+
+    # Intermediate level keywords (independent work, practical experience)
+    "Intermediate": (
+        "applied", "practical", "experience", "implemented", "developed", "built",
+        "created", "designed", "intermediate", "proficient", "competent", "functional",
+        "working knowledge", "solid understanding", "hands-on", "1-3 years", "participated in",
+        "contributed to", "team member", "handled", "responsible for", "managed", "maintained"
+    ),
+
+    # Advanced level keywords (mastery, leadership, complex problem solving)
+    "Advanced": (
+        "advanced", "extensive", "expert", "specialized", "in-depth", "thorough",
+        "comprehensive", "mastery", "proficiency", "seasoned", "strong", "3-5 years",
+        "led", "orchestrated", "architected", "complex", "mentor", "trained others",
+        "significant", "major", "key contributor", "senior", "optimization", "innovative",
+        "solutions"
+    ),
+
+    # Expert level keywords (thought leadership, innovation, strategic impact)
+    "Expert": (
+        "expert", "authority", "specialist", "thought leader", "5+ years", "deep expertise",
+        "recognized", "acclaimed", "pioneered", "strategic", "outstanding", "exceptional",
+        "cutting-edge", "industry leader", "speaker", "published", "researcher", "invented",
+        "patent", "revolutionized", "transformed", "principal", "consultant", "advisor"
+    )
+}
+
+# Term complexity indicators based on Cognitive Complexity Framework (Bloom et al.)
+COGNITIVE_INDICATORS = {
+    "Beginner": (
+        "understand", "define", "describe", "identify", "list", "recognize", "recall",
+        "memorize", "observe", "know", "label", "follow", "assist", "watch"
+    ),
+
+    "Intermediate": (
+        "apply", "implement", "use", "demonstrate", "operate", "solve", "calculate",
+        "illustrate", "modify", "perform", "prepare", "produce", "translate"
+    ),
+
+    "Advanced": (
+        "analyze", "compare", "contrast", "differentiate", "examine", "test", "investigate",
+        "categorize", "critique", "diagnose", "integrate", "organize", "plan", "design"
+    ),
+
+    "Expert": (
+        "evaluate", "assess", "appraise", "conclude", "convince", "judge", "recommend",
+        "create", "develop", "invent", "construct", "formulate", "author", "innovate",
+        "theorize", "synthesize", "generate", "predict", "propose", "devise"
+    )
+}
+
+# Duration indicators based on research on skill acquisition times
+# (Ericsson's 10,000 hour rule, Simon & Chase chess expertise studies)
+DURATION_INDICATORS = {
+    "Beginner": (
+        r"(?<!\d)(\d{1,2})\s*(?:day|week|month)s?",
+        r"less than (?:a|one|1)\s*year",
+        r"recently",
+        r"(?<!\d)1\s*year"
+    ),
+
+    "Intermediate": (
+        r"(?<!\d)([1-3])\s*years?",
+        r"(?:a|one|1)\s*year",
+        r"couple\s*(?:of)?\s*years"
+    ),
+
+    "Advanced": (
+        r"(?<!\d)([3-5])\s*years?",
+        r"several\s*years",
+        r"extensive experience"
+    ),
+
+    "Expert": (
+        r"(?<!\d)([5-9]|1\d+)\s*years?",
+        r"(?<!\d)\d{2,}\s*years?",
+        r"over (?:a|one)?\s*decade",
+        r"decades of",
+        r"(?:long|extensive)\s*(?:career|history|background)"
+    )
+}
+
+# Project scale indicators based on project complexity research (Xia & Lee, 2005)
+PROJECT_SCALE_INDICATORS = {
+    "Beginner": (
+        "small", "minor", "simple", "basic", "single", "individual", "personal"
+    ),
+
+    "Intermediate": (
+        "moderate", "team", "project", "component", "module", "feature"
+    ),
+
+    "Advanced": (
+        "large", "complex", "significant", "major", "system", "platform", "product",
+        "enterprise", "organization", "department"
+    ),
+
+    "Expert": (
+        "enterprise-wide", "cross-organizational", "industry", "global", "international",
+        "multi-system", "critical", "strategic", "nationwide", "worldwide"
+    )
+}
+
+# Responsibility level indicators (based on Jaques' Levels of Work complexity)
+RESPONSIBILITY_INDICATORS = {
+    "Beginner": (
+        "assisted", "helped", "supported", "followed", "performed", "conducted",
+        "observed", "shadowed", "participated"
+    ),
+
+    "Intermediate": (
+        "contributed", "implemented", "executed", "handled", "coordinated", "developed",
+        "managed", "responsible for"
+    ),
+
+    "Advanced": (
+        "led", "designed", "architected", "directed", "orchestrated", "supervised",
+        "guided", "oversaw", "mentored", "headed", "spearheaded"
+    ),
+
+    "Expert": (
+        "chief", "principal", "head", "executive", "founder", "creator", "pioneered",
+        "established", "strategized", "transformed", "revolutionized", "keynote"
+    )
+}
+
+# Certification level indicators
+CERTIFICATION_INDICATORS = {
+    "Beginner": (
+        "fundamentals", "foundations", "associate", "entry", "basic", "introduction"
+    ),
+
+    "Intermediate": (
+        "practitioner", "professional", "regular", "standard", "applied", "certified"
+    ),
+
+    "Advanced": (
+        "advanced", "expert", "senior", "specialist", "professional", "architect"
+    ),
+
+    "Expert": (
+        "master", "distinguished", "elite", "principal", "fellow", "authority",
+        "subject matter expert", "distinguished"
+    )
+}
+
+# Weights for different types of evidence
+# Based on research by Schmidt & Hunter (1998) on the validity of different selection methods
+EVIDENCE_WEIGHTS = {
+    "duration": 0.25,        # Schmidt & Hunter found work experience duration has 0.18 validity
+    "keywords": 0.15,        # General term matches 
+    "cognitive": 0.20,       # Cognitive complexity has higher validity
+    "projects": 0.20,        # Project work has 0.35 validity in Schmidt & Hunter
+    "responsibility": 0.25,  # Level of responsibility/work samples have 0.54 validity
+    "certification": 0.10    # Certifications/training has 0.10 validity
+}
+
+# Terms that mark a certification mention
+CERTIFICATION_TERMS = (
+    "certification", "certificate", "certified", "credential", "qualification", 
+    "diploma", "degree", "license"
+)
+
+CERTIFICATION_TERM_RE = re.compile('|'.join(re.escape(term) for term in CERTIFICATION_TERMS))
+
+# Literal text that every duration pattern needs in its match
+DURATION_ANCHORS = (
+    "day", "week", "month", "year", "recently", "extensive experience",
+    "decade", "career", "history", "background"
+)
+
+# Source literature for the proficiency assessment methodology
+LITERATURE_SOURCES = (
+    {
+        "title": "The Cambridge Handbook of Expertise and Expert Performance",
+        "authors": "Ericsson, K. A., Hoffman, R. R., Kozbelt, A., & Williams, A. M. (Eds.)",
+        "year": 2018,
+        "publisher": "Cambridge University Press",
+        "citation": "Establishes the 'deliberate practice' framework and outlines how expertise develops across domains."
+    },
+    {
+        "title": "Mind over Machine: The Power of Human Intuition and Expertise in the Era of the Computer",
+        "authors": "Dreyfus, H. L., & Dreyfus, S. E.",
+        "year": 1986,
+        "publisher": "The Free Press",
+        "citation": "Proposed the influential five-stage model of skill acquisition from novice to expert."
+    },
+    {
+        "title": "A Taxonomy for Learning, Teaching, and Assessing: A Revision of Bloom's Taxonomy of Educational Objectives",
+        "authors": "Anderson, L. W., Krathwohl, D. R., & Bloom, B. S.",
+        "year": 2001,
+        "publisher": "Longman",
+        "citation": "Presents the revised Bloom's taxonomy, showing progression from knowledge to creation."
+    },
+    {
+        "title": "The validity and utility of selection methods in personnel psychology: Practical and theoretical implications of 85 years of research findings",
+        "authors": "Schmidt, F. L., & Hunter, J. E.",
+        "year": 1998,
+        "journal": "Psychological Bulletin, 124(2), 262-274",
+        "citation": "Meta-analysis showing the predictive validity of different assessment methods for job performance."
+    },
+    {
+        "title": "The Role of Deliberate Practice in the Acquisition of Expert Performance",
+        "authors": "Ericsson, K. A., Krampe, R. T., & Tesch-Römer, C.",
+        "year": 1993,
+        "journal": "Psychological Review, 100(3), 363-406",
+        "citation": "Pioneering study on the role of deliberate practice in developing expertise."
+    },
+    {
+        "title": "Acquisition of chess skill",
+        "authors": "Simon, H. A., & Chase, W. G.",
+        "year": 1973,
+        "journal": "American Scientist, 61(4), 394-403",
+        "citation": "Classic study on expertise development through structured knowledge in chess."
+    }
+)
+
 class ProficiencyCalculator:
     """
     Calculate proficiency levels for skills based on academic research on skill acquisition
@@ -16,236 +252,122 @@ class ProficiencyCalculator:
     
     def __init__(self):
         """Initialize the proficiency calculator with research-based indicators"""
-        # Ensure NLTK data is downloaded
-        try:
-            nltk.data.find('tokenizers/punkt')
-        except (LookupError, ImportError):
-            try:
-                nltk.download('punkt')
-            except:
-                logger.warning("NLTK download failed, continuing without sentence tokenization")
-            
-        # Proficiency levels based on Dreyfus & Dreyfus Model (1980, 1986)
-        # and Bloom's Taxonomy of Educational Objectives (1956, revised 2001)
-        self.proficiency_levels = [
-            "Beginner",        # Novice level - rule-based behavior, limited situational perception
-            "Intermediate",    # Advanced beginner - situational perception still limited
-            "Advanced",        # Competent - sees actions as part of broader goals
-            "Expert"           # Proficient/Expert - intuitive grasp of situations, analytical approaches
-        ]
-        
-        # Keywords indicating different proficiency levels (based on research by Chi et al., 2014;
-        # Ericsson et al., 1993; Simon & Chase, 1973 on expertise development)
-        self.proficiency_indicators = {
-            # Beginner level keywords (rule-following, assisted work)
-            "Beginner": [
-                "basic", "familiar", "learning", "entry-level", "fundamental", "coursework", 
-                "introduction", "beginner", "novice", "studied", "exposure to", "classroom",
-                "training", "guided", "assisted", "supervised", "academic", "course", "101",
-                "recently", "new to"
-            ],
-            
-            # Intermediate level keywords (independent work, practical experience)
-            "Intermediate": [
-                "applied", "practical", "experience", "implemented", "developed", "built",
-                "created", "designed", "intermediate", "proficient", "competent", "functional",
-                "working knowledge", "solid understanding", "hands-on", "1-3 years", "participated in",
-                "contributed to", "team member", "handled", "responsible for", "managed", "maintained"
-            ],
-            
-            # Advanced level keywords (mastery, leadership, complex problem solving)
-            "Advanced": [
-                "advanced", "extensive", "expert", "specialized", "in-depth", "thorough",
-                "comprehensive", "mastery", "proficiency", "seasoned", "strong", "3-5 years",
-                "led", "orchestrated", "architected", "complex", "mentor", "trained others",
-                "significant", "major", "key contributor", "senior", "optimization", "innovative",
-                "solutions"
-            ],
-            
-            # Expert level keywords (thought leadership, innovation, strategic impact)
-            "Expert": [
-                "expert", "authority", "specialist", "thought leader", "5+ years", "deep expertise",
-                "recognized", "acclaimed", "pioneered", "strategic", "outstanding", "exceptional",
-                "cutting-edge", "industry leader", "speaker", "published", "researcher", "invented",
-                "patent", "revolutionized", "transformed", "principal", "consultant", "advisor"
-            ]
+        # Indicator tables and weights are module-level constants shared by
+        # every instance
+        self.proficiency_levels = PROFICIENCY_LEVELS
+        self.proficiency_indicators = PROFICIENCY_INDICATORS
+        self.cognitive_indicators = COGNITIVE_INDICATORS
+        self.duration_indicators = DURATION_INDICATORS
+        self.project_scale_indicators = PROJECT_SCALE_INDICATORS
+        self.responsibility_indicators = RESPONSIBILITY_INDICATORS
+        self.certification_indicators = CERTIFICATION_INDICATORS
+        self.evidence_weights = EVIDENCE_WEIGHTS
+        
+        # Indicators counted as whole words, with the weight of each match
+        self._word_indicator_sets = {
+            "cognitive": (self.cognitive_indicators, 1.2),             # Give stronger weight to cognitive indicators
+            "projects": (self.project_scale_indicators, 1.0),
+            "responsibility": (self.responsibility_indicators, 1.3)    # Responsibility has high validity
         }
         
-        # Term complexity indicators based on Cognitive Complexity Framework (Bloom et al.)
-        self.cognitive_indicators = {
-            "Beginner": [
-                "understand", "define", "describe", "identify", "list", "recognize", "recall",
-                "memorize", "observe", "know", "label", "follow", "assist", "watch"
-            ],
-            
-            "Intermediate": [
-                "apply", "implement", "use", "demonstrate", "operate", "solve", "calculate",
-                "illustrate", "modify", "perform", "prepare", "produce", "translate"
-            ],
-            
-            "Advanced": [
-                "analyze", "compare", "contrast", "differentiate", "examine", "test", "investigate",
-                "categorize", "critique", "diagnose", "integrate", "organize", "plan", "design"
-            ],
-            
-            "Expert": [
-                "evaluate", "assess", "appraise", "conclude", "convince", "judge", "recommend",
-                "create", "develop", "invent", "construct", "formulate", "author", "innovate",
-                "theorize", "synthesize", "generate", "predict", "propose", "devise"
-            ]
-        }
+        # Memoize evidence and results per instance: batch callers pass the same
+        # text for every skill, so the skill-independent evidence is reused
+        self._context_evidence = functools.lru_cache(maxsize=256)(self._collect_context_evidence)
+        self._context_level_scores = functools.lru_cache(maxsize=256)(self._sum_context_evidence)
+        self._context_certification = functools.lru_cache(maxsize=256)(self._collect_certification_levels)
+        self._cached_proficiency = functools.lru_cache(maxsize=4096)(self._calculate_proficiency)
         
-        # Duration indicators based on research on skill acquisition times
-        # (Ericsson's 10,000 hour rule, Simon & Chase chess expertise studies)
-        self.duration_indicators = {
-            "Beginner": [
-                r"(?<!\d)(\d{1,2})\s*(?:day|week|month)s?",
-                r"less than (?:a|one|1)\s*year",
-                r"recently",
-                r"(?<!\d)1\s*year"
-            ],
-            
-            "Intermediate": [
-                r"(?<!\d)([1-3])\s*years?",
-                r"(?:a|one|1)\s*year",
-                r"couple\s*(?:of)?\s*years"
-            ],
-            
-            "Advanced": [
-                r"(?<!\d)([3-5])\s*years?",
-                r"several\s*years",
-                r"extensive experience"
-            ],
-            
-            "Expert": [
-                r"(?<!\d)([5-9]|1\d+)\s*years?",
-                r"(?<!\d)\d{2,}\s*years?",
-                r"over (?:a|one)?\s*decade",
-                r"decades of",
-                r"(?:long|extensive)\s*(?:career|history|background)"
-            ]
+        # Source literature for the proficiency assessment methodology
+        self.literature_sources = LITERATURE_SOURCES
+        
+    @functools.cached_property
+    def _duration_re(self):
+        """Duration patterns per level, compiled on first use; counted separately because some overlap"""
+        return {
+            level: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+            for level, patterns in self.duration_indicators.items()
         }
         
-        # Project scale indicators based on project complexity research (Xia & Lee, 2005)
-        self.project_scale_indicators = {
-            "Beginner": [
-                "small", "minor", "simple", "basic", "single", "individual", "personal"
-            ],
-            
-            "Intermediate": [
-                "moderate", "team", "project", "component", "module", "feature"
-            ],
-            
-            "Advanced": [
-                "large", "complex", "significant", "major", "system", "platform", "product",
-                "enterprise", "organization", "department"
-            ],
-            
-            "Expert": [
-                "enterprise-wide", "cross-organizational", "industry", "global", "international",
-                "multi-system", "critical", "strategic", "nationwide", "worldwide"
-            ]
-        }
+    def _iter_keywords(self):
+        """Yield (keyword, level, weight) for every proficiency keyword in indicator order"""
+        for level, keywords in self.proficiency_indicators.items():
+            for keyword in keywords:
+                # For multi-word indicators, give more weight
+                weight = 1.5 if len(keyword.split()) > 1 else 1.0
+                yield keyword, level, weight
+                
+    @functools.cached_property
+    def _keyword_entries(self):
+        """(level, weight) per proficiency keyword, in indicator order"""
+        return [(level, weight) for _, level, weight in self._iter_keywords()]
         
-        # Responsibility level indicators (based on Jaques' Levels of Work complexity)
-        self.responsibility_indicators = {
-            "Beginner": [
-                "assisted", "helped", "supported", "followed", "performed", "conducted",
-                "observed", "shadowed", "participated"
-            ],
-            
-            "Intermediate": [
-                "contributed", "implemented", "executed", "handled", "coordinated", "developed",
-                "managed", "responsible for"
-            ],
-            
-            "Advanced": [
-                "led", "designed", "architected", "directed", "orchestrated", "supervised",
-                "guided", "oversaw", "mentored", "headed", "spearheaded"
-            ],
-            
-            "Expert": [
-                "chief", "principal", "head", "executive", "founder", "creator", "pioneered",
-                "established", "strategized", "transformed", "revolutionized", "keynote"
-            ]
-        }
+    @functools.cached_property
+    def _indicator_automaton(self):
+        """
+        Aho-Corasick automaton over the lowercased proficiency keywords and word
+        indicators, built on first use. It also holds the duration anchors and
+        certification terms so a single scan can tell when a context has no
+        evidence at all
         
-        # Certification level indicators
-        self.certification_indicators = {
-            "Beginner": [
-                "fundamentals", "foundations", "associate", "entry", "basic", "introduction"
-            ],
-            
-            "Intermediate": [
-                "practitioner", "professional", "regular", "standard", "applied", "certified"
-            ],
-            
-            "Advanced": [
-                "advanced", "expert", "senior", "specialist", "professional", "architect"
-            ],
+        Returns:
+            ahocorasick.Automaton: Maps each phrase to (keyword entry indices,
+                phrase length, word indicator pairs)
+        """
+        keyword_indices = defaultdict(list)
+        indicator_pairs = defaultdict(list)
+        
+        for index, (keyword, _, _) in enumerate(self._iter_keywords()):
+            keyword_indices[keyword.lower()].append(index)
             
-            "Expert": [
-                "master", "distinguished", "elite", "principal", "fellow", "authority",
-                "subject matter expert", "distinguished"
-            ]
-        }
+        for evidence_type, (indicators, _) in self._word_indicator_sets.items():
+            for level, words in indicators.items():
+                for word in words:
+                    indicator_pairs[word.lower()].append((evidence_type, level))
+                    
+        automaton = ahocorasick.Automaton()
+        for phrase in keyword_indices.keys() | indicator_pairs.keys():
+            automaton.add_word(phrase, (tuple(keyword_indices.get(phrase, ())),
+                                        len(phrase),
+                                        tuple(indicator_pairs.get(phrase, ()))))
+                                        
+        # Presence-only terms carry no entries
+        for phrase in DURATION_ANCHORS + CERTIFICATION_TERMS:
+            if phrase not in automaton:
+                automaton.add_word(phrase, ((), len(phrase), ()))
+        automaton.make_automaton()
+        
+        return automaton
+        
+    def _scan_indicators(self, context):
+        """
+        Scan the context once for proficiency keywords and word indicators
         
-        # Weights for different types of evidence
-        # Based on research by Schmidt & Hunter (1998) on the validity of different selection methods
-        self.evidence_weights = {
-            "duration": 0.25,        # Schmidt & Hunter found work experience duration has 0.18 validity
-            "keywords": 0.15,        # General term matches 
-            "cognitive": 0.20,       # Cognitive complexity has higher validity
-            "projects": 0.20,        # Project work has 0.35 validity in Schmidt & Hunter
-            "responsibility": 0.25,  # Level of responsibility/work samples have 0.54 validity
-            "certification": 0.10    # Certifications/training has 0.10 validity
-        }
+        Args:
+            context (str): The lowercased context to analyze
+            
+        Returns:
+            tuple: (keyword_hits, indicator_counts) where keyword_hits is the set
+                of keyword entry indices present in the context and
+                indicator_counts counts whole-word matches per (evidence_type, level)
+        """
+        last = len(context) - 1
+        keyword_hits = set()
+        indicator_counts = Counter()
         
-        # Source literature for the proficiency assessment methodology
-        self.literature_sources = [
-            {
-                "title": "The Cambridge Handbook of Expertise and Expert Performance",
-                "authors": "Ericsson, K. A., Hoffman, R. R., Kozbelt, A., & Williams, A. M. (Eds.)",
-                "year": 2018,
-                "publisher": "Cambridge University Press",
-                "citation": "Establishes the 'deliberate practice' framework and outlines how expertise develops across domains."
-            },
-            {
-                "title": "Mind over Machine: The Power of Human Intuition and Expertise in the Era of the Computer",
-                "authors": "Dreyfus, H. L., & Dreyfus, S. E.",
-                "year": 1986,
-                "publisher": "The Free Press",
-                "citation": "Proposed the influential five-stage model of skill acquisition from novice to expert."
-            },
-            {
-                "title": "A Taxonomy for Learning, Teaching, and Assessing: A Revision of Bloom's Taxonomy of Educational Objectives",
-                "authors": "Anderson, L. W., Krathwohl, D. R., & Bloom, B. S.",
-                "year": 2001,
-                "publisher": "Longman",
-                "citation": "Presents the revised Bloom's taxonomy, showing progression from knowledge to creation."
-            },
-            {
-                "title": "The validity and utility of selection methods in personnel psychology: Practical and theoretical implications of 85 years of research findings",
-                "authors": "Schmidt, F. L., & Hunter, J. E.",
-                "year": 1998,
-                "journal": "Psychological Bulletin, 124(2), 262-274",
-                "citation": "Meta-analysis showing the predictive validity of different assessment methods for job performance."
-            },
-            {
-                "title": "The Role of Deliberate Practice in the Acquisition of Expert Performance",
-                "authors": "Ericsson, K. A., Krampe, R. T., & Tesch-Römer, C.",
-                "year": 1993,
-                "journal": "Psychological Review, 100(3), 363-406",
-                "citation": "Pioneering study on the role of deliberate practice in developing expertise."
-            },
-            {
-                "title": "Acquisition of chess skill",
-                "authors": "Simon, H. A., & Chase, W. G.",
-                "year": 1973,
-                "journal": "American Scientist, 61(4), 394-403",
-                "citation": "Classic study on expertise development through structured knowledge in chess."
-            }
-        ]
+        for end, (indices, length, pairs) in self._indicator_automaton.iter(context):
+            # Keywords count on any substring match
+            keyword_hits.update(indices)
+            
+            # Word indicators only count as whole words, like \b...\b
+            if pairs:
+                start = end - length + 1
+                if start > 0 and (context[start - 1].isalnum() or context[start - 1] == '_'):
+                    continue
+                if end < last and (context[end + 1].isalnum() or context[end + 1] == '_'):
+                    continue
+                indicator_counts.update(pairs)
+                
+        return keyword_hits, indicator_counts
         
     def calculate_proficiency(self, skill_name, context):
         """
@@ -261,27 +383,32 @@ class ProficiencyCalculator:
         if not context:
             return None, 0.0
             
-        context = context.lower()
-        skill_name = skill_name.lower()
+        return self._cached_proficiency(skill_name.lower(), context.lower())
         
-        # Evidence collection based on different types of indicators
-        evidence = {
-            "duration": self._extract_duration_evidence(context),
-            "keywords": self._extract_keyword_evidence(context),
-            "cognitive": self._extract_cognitive_evidence(context),
-            "projects": self._extract_project_evidence(context),
-            "responsibility": self._extract_responsibility_evidence(context),
-            "certification": self._extract_certification_evidence(context, skill_name)
-        }
-        
-        # Calculate weighted scores for each proficiency level
-        level_scores = defaultdict(float)
+    def _calculate_proficiency(self, skill_name, context):
+        """
+        Uncached body of calculate_proficiency
         
-        for evidence_type, evidence_data in evidence.items():
-            weight = self.evidence_weights.get(evidence_type, 0.1)
+        Args:
+            skill_name (str): The lowercased name of the skill
+            context (str): The lowercased context in which the skill appears
             
-            for level, score in evidence_data.items():
-                level_scores[level] += score * weight
+        Returns:
+            tuple: (proficiency_level, confidence_score)
+        """
+        # Without any indicator, duration anchor or certification term the
+        # context cannot yield evidence, so skip the extractors
+        if next(self._indicator_automaton.iter(context), None) is None:
+            return None, 0.0
+            
+        # Start from the weighted scores shared by every skill in this context
+        # and add the only skill-dependent evidence, certification, last
+        level_scores = defaultdict(float, self._context_level_scores(context))
+        
+        certification = self._apply_evidence_weight(
+            "certification", self._extract_certification_evidence(context, skill_name))
+        for level, score in certification.items():
+            level_scores[level] += score
         
         # Handle case with no evidence
         if not level_scores:
@@ -292,115 +419,149 @@ class ProficiencyCalculator:
         if total_score == 0:
             return None, 0.0
             
-        # Normalize the scores
-        normalized_scores = {level: score/total_score for level, score in level_scores.items()}
-        
-        # Find the level with the highest normalized score
-        best_level = max(normalized_scores.items(), key=lambda x: x[1])
-        proficiency_level = best_level[0]
-        confidence = best_level[1]
+        # Normalizing by the total does not change which level is highest, so
+        # only the winning score is divided
+        proficiency_level = max(level_scores, key=level_scores.__getitem__)
+        confidence = level_scores[proficiency_level] / total_score
         
         return proficiency_level, confidence
     
-    def _extract_duration_evidence(self, context):
-        """Extract evidence related to duration of experience"""
-        evidence = defaultdict(float)
+    def _collect_context_evidence(self, context):
+        """
+        Collect the evidence that depends only on the context, not on the skill
         
-        for level, patterns in self.duration_indicators.items():
-            for pattern in patterns:
-                matches = re.findall(pattern, context, re.IGNORECASE)
-                if matches:
-                    # If we find numeric matches, use them to strengthen the evidence
-                    for match in matches:
-                        if isinstance(match, tuple) and len(match) > 0 and match[0].isdigit():
-                            # Extract the numeric value
-                            value = int(match[0])
-                            evidence[level] += value * 0.1  # More years = stronger evidence
-                        else:
-                            evidence[level] += 1.0
+        Args:
+            context (str): The lowercased context to analyze
+            
+        Returns:
+            dict: Weighted evidence scores per level, keyed by evidence type
+        """
+        keyword_hits, indicator_counts = self._scan_indicators(context)
         
-        return evidence
-    
-    def _extract_keyword_evidence(self, context):
-        """Extract evidence related to general proficiency keywords"""
-        evidence = defaultdict(float)
+        evidence = {
+            "duration": self._extract_duration_evidence(context),
+            "keywords": self._extract_keyword_evidence(keyword_hits)
+        }
+        evidence.update(self._extract_word_indicator_evidence(indicator_counts))
         
-        words = re.findall(r'\b\w+\b', context.lower())
-        words_set = set(words)
+        return {evidence_type: self._apply_evidence_weight(evidence_type, scores)
+                for evidence_type, scores in evidence.items()}
         
-        for level, keywords in self.proficiency_indicators.items():
-            for keyword in keywords:
-                if keyword.lower() in context.lower():
-                    # For multi-word indicators, give more weight
-                    if len(keyword.split()) > 1:
-                        evidence[level] += 1.5
-                    else:
-                        evidence[level] += 1.0
+    def _sum_context_evidence(self, context):
+        """
+        Sum the weighted skill-independent evidence per level
         
-        return evidence
-    
-    def _extract_cognitive_evidence(self, context):
-        """Extract evidence related to cognitive complexity"""
-        evidence = defaultdict(float)
+        Args:
+            context (str): The lowercased context to analyze
+            
+        Returns:
+            dict: Weighted score per level
+        """
+        level_scores = defaultdict(float)
+        
+        for evidence_data in self._context_evidence(context).values():
+            for level, score in evidence_data.items():
+                level_scores[level] += score
+                
+        return dict(level_scores)
+        
+    def _apply_evidence_weight(self, evidence_type, scores):
+        """Scale evidence scores by the weight of their evidence type"""
+        weight = self.evidence_weights.get(evidence_type, 0.1)
+        return {level: score * weight for level, score in scores.items()}
         
-        for level, verbs in self.cognitive_indicators.items():
-            for verb in verbs:
-                # Look for these verbs as full words
-                matches = re.findall(r'\b' + re.escape(verb) + r'\b', context.lower())
-                # Give stronger weight to cognitive indicators
-                evidence[level] += len(matches) * 1.2
+    def _collect_evidence(self, skill_name, context):
+        """
+        Collect all evidence for a skill, reusing cached context evidence
         
+        Args:
+            skill_name (str): The lowercased name of the skill
+            context (str): The lowercased context in which the skill appears
+            
+        Returns:
+            dict: Weighted evidence scores per level, keyed by evidence type
+        """
+        evidence = dict(self._context_evidence(context))
+        evidence["certification"] = self._apply_evidence_weight(
+            "certification", self._extract_certification_evidence(context, skill_name))
         return evidence
     
-    def _extract_project_evidence(self, context):
-        """Extract evidence related to project scale"""
+    def _extract_duration_evidence(self, context):
+        """Extract evidence related to duration of experience"""
         evidence = defaultdict(float)
         
-        for level, indicators in self.project_scale_indicators.items():
-            for indicator in indicators:
-                matches = re.findall(r'\b' + re.escape(indicator) + r'\b', context.lower())
-                evidence[level] += len(matches) * 1.0
+        for level, patterns in self._duration_re.items():
+            # Every match counts once; the numeric groups only constrain the
+            # patterns and are never weighted by their value
+            matches = sum(len(pattern.findall(context)) for pattern in patterns)
+            if matches:
+                evidence[level] += matches
         
         return evidence
     
-    def _extract_responsibility_evidence(self, context):
-        """Extract evidence related to level of responsibility"""
+    def _extract_keyword_evidence(self, hits):
+        """Extract evidence related to general proficiency keywords"""
         evidence = defaultdict(float)
         
-        for level, indicators in self.responsibility_indicators.items():
-            for indicator in indicators:
-                matches = re.findall(r'\b' + re.escape(indicator) + r'\b', context.lower())
-                # Responsibility has high validity, so give it more weight
-                evidence[level] += len(matches) * 1.3
+        # Each keyword present in the context counts once
+        for index in sorted(hits):
+            level, weight = self._keyword_entries[index]
+            evidence[level] += weight
         
         return evidence
     
+    def _extract_word_indicator_evidence(self, counts):
+        """Extract cognitive complexity, project scale and responsibility evidence from match counts"""
+        evidence = {}
+        for evidence_type, (indicators, weight) in self._word_indicator_sets.items():
+            type_evidence = defaultdict(float)
+            for level in indicators:
+                type_evidence[level] += counts[(evidence_type, level)] * weight
+            evidence[evidence_type] = type_evidence
+            
+        return evidence
+    
     def _extract_certification_evidence(self, context, skill_name):
         """Extract evidence related to certifications"""
         evidence = defaultdict(float)
         
-        # Check if the context indicates certification in this skill
-        contains_cert = any(term in context.lower() for term in [
-            "certification", "certificate", "certified", "credential", "qualification", 
-            "diploma", "degree", "license"
-        ])
-        
-        if contains_cert and skill_name in context.lower():
-            # If certification is mentioned with the skill, check the level
-            for level, indicators in self.certification_indicators.items():
-                for indicator in indicators:
-                    if indicator.lower() in context.lower():
-                        evidence[level] += 1.0
-                        
-            # If no specific level is detected but certification exists, default to intermediate
-            if sum(evidence.values()) == 0:
-                evidence["Intermediate"] += 0.8
+        # Certification evidence only counts if the skill is mentioned with it
+        if skill_name in context:
+            evidence.update(self._context_certification(context))
         
         return evidence
+        
+    def _collect_certification_levels(self, context):
+        """
+        Collect the certification level evidence of a context, independent of the skill
+        
+        Args:
+            context (str): The lowercased context to analyze
+            
+        Returns:
+            dict: Evidence scores per level, empty if no certification is mentioned
+        """
+        evidence = defaultdict(float)
+        
+        # Check if the context indicates certification
+        if not CERTIFICATION_TERM_RE.search(context):
+            return {}
+            
+        # If certification is mentioned, check the level
+        for level, indicators in self.certification_indicators.items():
+            for indicator in indicators:
+                if indicator.lower() in context:
+                    evidence[level] += 1.0
+                    
+        # If no specific level is detected but certification exists, default to intermediate
+        if sum(evidence.values()) == 0:
+            evidence["Intermediate"] += 0.8
+            
+        return dict(evidence)
     
     def get_literature_sources(self):
         """Return the literature sources used for proficiency assessment methodology"""
-        return self.literature_sources
+        return list(self.literature_sources)
     
     def explain_proficiency_assessment(self, skill_name, context, proficiency_level, confidence):
         """
@@ -425,14 +586,7 @@ class ProficiencyCalculator:
         }
         
         # Extract key indicators that contributed to this assessment
-        evidence = {
-            "duration": self._extract_duration_evidence(context),
-            "keywords": self._extract_keyword_evidence(context),
-            "cognitive": self._extract_cognitive_evidence(context),
-            "projects": self._extract_project_evidence(context),
-            "responsibility": self._extract_responsibility_evidence(context),
-            "certification": self._extract_certification_evidence(context, skill_name)
-        }
+        evidence = self._collect_evidence(skill_name.lower(), context.lower())
         
         # Identify top indicators for this proficiency level
         if proficiency_level:
@@ -518,8 +672,15 @@ class ProficiencyCalculator:
         """
         updated_skills = []
         
+        # Lowercase the shared text once; its evidence is then computed for the
+        # first skill and reused for the rest
+        text_lower = text.lower() if text else text
+        
         for skill in skills:
-            proficiency, confidence = self.calculate_proficiency(skill.name, text)
+            if text_lower:
+                proficiency, confidence = self._cached_proficiency(skill.name.lower(), text_lower)
+            else:
+                proficiency, confidence = None, 0.0
             
             if proficiency:
                 skill.proficiency = proficiency
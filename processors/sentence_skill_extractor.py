@@ -1,20 +1,65 @@
 import re
 import logging
+import functools
+import threading
+from collections import OrderedDict
 import spacy
+import ahocorasick
 from typing import List, Dict, Any, Set, Optional
 from utils.skill_database import SkillDatabase
 
 # Initialize logging
 logger = logging.getLogger('sentence_skill_extractor')
 
+# Only the parser and tagger output (dependencies, POS, noun chunks) is used;
+# the attribute ruler stays because it maps tags to the POS values we check
+EXCLUDED_PIPES = ("ner", "lemmatizer")
+
 try:
-    # Try loading the language model for NER and dependency parsing
-    nlp = spacy.load("en_core_web_md")
+    # Try loading the language model for dependency parsing
+    nlp = spacy.load("en_core_web_md", exclude=EXCLUDED_PIPES)
 except OSError:
     # Fall back to a simpler model if the larger one isn't available
-    nlp = spacy.load("en_core_web_sm")
+    nlp = spacy.load("en_core_web_sm", exclude=EXCLUDED_PIPES)
     logger.warning("Using smaller spaCy model. For better results, install en_core_web_md")
 
+# Blank lines separate paragraphs, which are parsed as independent texts
+PARAGRAPH_SPLIT_RE = re.compile(r'\n\s*\n')
+
+# Recently parsed Docs, keyed by their text
+_DOC_CACHE_SIZE = 64
+_doc_cache = OrderedDict()
+_doc_cache_lock = threading.Lock()
+
+def _parse_texts(texts: List[str]) -> list:
+    """
+    Parse texts with spaCy in batches, reusing the Docs of recently seen texts
+    
+    Args:
+        texts (list): Texts to parse
+        
+    Returns:
+        list: One Doc per text, in order
+    """
+    docs = {}
+    with _doc_cache_lock:
+        for text in texts:
+            if text in _doc_cache:
+                _doc_cache.move_to_end(text)
+                docs[text] = _doc_cache[text]
+                
+    missing = [text for text in dict.fromkeys(texts) if text not in docs]
+    for text, doc in zip(missing, nlp.pipe(missing, batch_size=32)):
+        docs[text] = doc
+        
+    with _doc_cache_lock:
+        for text in missing:
+            _doc_cache[text] = docs[text]
+            if len(_doc_cache) > _DOC_CACHE_SIZE:
+                _doc_cache.popitem(last=False)
+                
+    return [docs[text] for text in texts]
+
 class SentenceSkillExtractor:
     """
     Specialized extractor that identifies skills within sentences and descriptive text
@@ -31,6 +76,9 @@ class SentenceSkillExtractor:
         # Initialize skill database for validation and matching
         self.skill_db = SkillDatabase(custom_db_path)
         
+        # Candidate phrases repeat within a document, so memoize database lookups
+        self._known_skill = functools.lru_cache(maxsize=4096)(self._lookup_known_skill)
+        
         # Compile skill indication patterns - phrases that suggest skills
         self.skill_indicators = [
             r"experienced in ([\w\s,&/\-+]+)",
@@ -70,12 +118,31 @@ class SentenceSkillExtractor:
         # Compile patterns
         self.compiled_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in self.skill_indicators]
         
+        # Literal text that every indicator match contains; lines with none of
+        # it cannot match any pattern and are skipped with a single search
+        indicator_anchors = [
+            "experienced in ", "expertise in ", "skilled in ", "proficient in ", "knowledge of ",
+            "familiar with ", "specializing in ", "certified in ", "trained in ", "experience with ",
+            "background in ", "abilities in ", "competent in ", "capability in ", " skills",
+            "expert in ", "database management", "relational database", "data modeling",
+            "version control", "database design", "database administration", " security",
+            "working with ", "managing ", "designing "
+        ]
+        self._indicator_anchor_re = re.compile('|'.join(re.escape(anchor) for anchor in indicator_anchors), re.IGNORECASE)
+        
+        # Separators between several skills in one pattern match; a conjunction
+        # after a comma or semicolon belongs to the separator ("A, B, and C")
+        self._separator_re = re.compile(r'\s*(?:[,;]\s*(?:and\s+)?|\s+and\s+)')
+        
         # Skill adjective markers - adjectives that often precede skills
-        self.skill_adjectives = {
+        self.skill_adjectives = frozenset([
             "strong", "excellent", "advanced", "proven", "expert", "proficient", 
             "skilled", "experienced", "knowledgeable", "capable", "effective",
             "outstanding", "exceptional", "superior", "solid", "comprehensive"
-        }
+        ])
+        
+        # Dependency labels followed when expanding a token into its full phrase
+        self._phrase_deps = frozenset(["amod", "compound", "nmod", "advmod", "conj", "cc", "prep", "pobj"])
         
         # Nouns/phrases often referred to as skills (to use when parsing sentences)
         self.skill_noun_indicators = {
@@ -93,6 +160,31 @@ class SentenceSkillExtractor:
             "database design", "database administration", "database security",
             "database optimization", "performance tuning", "query optimization"
         ]
+        
+        # Automaton over the compounds, mapping each to its position in the list
+        self._compound_automaton = ahocorasick.Automaton()
+        for index, compound in enumerate(self.technical_compounds):
+            self._compound_automaton.add_word(compound, index)
+        self._compound_automaton.make_automaton()
+        
+        # Technical-sounding terms used to guess whether an unknown skill is technical
+        technical_indicators = [
+            "software", "programming", "development", "system", 
+            "analysis", "database", "design", "implementation", 
+            "architecture", "network", "security", "data", "code",
+            "application", "platform", "framework", "language",
+            "algorithm", "automation", "engineering", "technical"
+        ]
+        self._technical_automaton = ahocorasick.Automaton()
+        for indicator in technical_indicators:
+            self._technical_automaton.add_word(indicator, indicator)
+        self._technical_automaton.make_automaton()
+        
+        # Common prefixes and articles stripped from skill text, in order
+        self._skill_prefixes = (
+            "a ", "an ", "the ", "some ", "many ", "various ", "excellent ", 
+            "strong ", "advanced ", "proven ", "effective ", "demonstrated "
+        )
     
     def extract_skills_from_text(self, text: str) -> List[Dict[str, Any]]:
         """
@@ -141,7 +233,7 @@ class SentenceSkillExtractor:
         
         for line in lines:
             line = line.strip()
-            if not line:
+            if not line or not self._indicator_anchor_re.search(line):
                 continue
                 
             # Apply each pattern to the line
@@ -159,18 +251,11 @@ class SentenceSkillExtractor:
                     if not skill_text:
                         continue
                     
-                    # For pattern matches, check for multiple skills (comma/and separated)
-                    if any(separator in skill_text for separator in [',', ' and ', ';']):
-                        # Split by common separators
-                        for splitter in [',', ' and ', ';']:
-                            if splitter in skill_text:
-                                parts = [p.strip() for p in skill_text.split(splitter)]
-                                for part in parts:
-                                    if part:
-                                        self._process_potential_skill(part, line, extracted_skills)
-                    else:
-                        # Process as a single skill
-                        self._process_potential_skill(skill_text, line, extracted_skills)
+                    # For pattern matches, split multiple skills (comma/and separated)
+                    # on every separator at once
+                    for part in self._separator_re.split(skill_text):
+                        if part:
+                            self._process_potential_skill(part, line, extracted_skills)
         
         return extracted_skills
     
@@ -186,11 +271,12 @@ class SentenceSkillExtractor:
         """
         extracted_skills = []
         
-        # Process with spaCy
-        doc = nlp(text)
+        # Process each paragraph with spaCy in one batch
+        paragraphs = [paragraph for paragraph in PARAGRAPH_SPLIT_RE.split(text) if paragraph.strip()]
+        sentences = [sent for doc in _parse_texts(paragraphs) for sent in doc.sents]
         
         # Extract skills from each sentence
-        for sent in doc.sents:
+        for sent in sentences:
             # Look for skill-indicating structures
             self._analyze_sentence_structure(sent, extracted_skills)
             
@@ -248,15 +334,17 @@ class SentenceSkillExtractor:
         Returns:
             str: The full phrase
         """
-        words = [token.text]
-        for child in token.children:
-            # Only include certain dependency types to avoid getting too much
-            if child.dep_ in ["amod", "compound", "nmod", "advmod", "conj", "cc", "prep", "pobj"]:
-                # Recursively get child phrases
-                child_phrase = self._get_full_phrase(child)
-                words.append(child_phrase)
-        
-        # Join all words, but handle order properly
+        # Walk the subtree depth-first with an explicit stack, visiting each
+        # token before its children, and join the words once at the end
+        words = []
+        stack = [token]
+        while stack:
+            current = stack.pop()
+            words.append(current.text)
+            # Only include certain dependency types to avoid getting too much;
+            # children are pushed in reverse so they pop in sentence order
+            stack.extend(child for child in reversed(list(current.children)) if child.dep_ in self._phrase_deps)
+        
         return " ".join(words)
     
     def _process_potential_skill(self, skill_text: str, context: str, extracted_skills: List[Dict[str, Any]]):
@@ -283,24 +371,26 @@ class SentenceSkillExtractor:
         if len(clean_skill) < 3:
             return
         
-        # Check for compound technical terms that should be kept together
-        for compound in self.technical_compounds:
-            if compound in clean_skill.lower():
-                # Found a technical compound term
-                extracted_skills.append({
-                    "name": compound.title(),  # Convert to title case
-                    "confidence_score": 0.85,  # High confidence for compound terms
-                    "source": "sentence_extraction",
-                    "context": context,
-                    "is_technical": True  # Technical compound terms are always technical
-                })
-                return
+        # Check for compound technical terms that should be kept together; the
+        # first compound in list order wins, as with a linear scan
+        compound_hits = [index for _, index in self._compound_automaton.iter(clean_skill.lower())]
+        if compound_hits:
+            compound = self.technical_compounds[min(compound_hits)]
+            # Found a technical compound term
+            extracted_skills.append({
+                "name": compound.title(),  # Convert to title case
+                "confidence_score": 0.85,  # High confidence for compound terms
+                "source": "sentence_extraction",
+                "context": context,
+                "is_technical": True  # Technical compound terms are always technical
+            })
+            return
         
         # Try to find in skill database
-        if self.skill_db.is_known_skill(clean_skill):
+        known_skill = self._known_skill(clean_skill)
+        if known_skill:
             # Use canonical name from database
-            canonical_name = self.skill_db.get_canonical_name(clean_skill)
-            category = self.skill_db.get_skill_category(canonical_name)
+            canonical_name, category = known_skill
             
             # Add to extracted skills
             extracted_skills.append({
@@ -321,6 +411,22 @@ class SentenceSkillExtractor:
                 "is_technical": self._guess_if_technical(clean_skill, context)
             })
     
+    def _lookup_known_skill(self, skill_text: str) -> Optional[tuple]:
+        """
+        Look up a skill in the database
+        
+        Args:
+            skill_text (str): Cleaned skill text
+            
+        Returns:
+            tuple: (canonical_name, category), or None if the skill is unknown
+        """
+        if not self.skill_db.is_known_skill(skill_text):
+            return None
+            
+        canonical_name = self.skill_db.get_canonical_name(skill_text)
+        return canonical_name, self.skill_db.get_skill_category(canonical_name)
+    
     def _clean_skill_text(self, text: str) -> str:
         """
         Clean skill text by removing unnecessary parts
@@ -331,14 +437,15 @@ class SentenceSkillExtractor:
         Returns:
             str: Cleaned skill text
         """
-        # Remove common prefixes and articles
-        prefixes = ["a ", "an ", "the ", "some ", "many ", "various ", "excellent ", 
-                   "strong ", "advanced ", "proven ", "effective ", "demonstrated "]
-        
+        # Remove common prefixes and articles, lowercasing only once; the
+        # tuple startswith skips the loop for text with no prefix at all
         clean_text = text.strip()
-        for prefix in prefixes:
-            if clean_text.lower().startswith(prefix):
-                clean_text = clean_text[len(prefix):]
+        lower_text = clean_text.lower()
+        if lower_text.startswith(self._skill_prefixes):
+            for prefix in self._skill_prefixes:
+                if lower_text.startswith(prefix):
+                    clean_text = clean_text[len(prefix):]
+                    lower_text = lower_text[len(prefix):]
         
         # Remove trailing punctuation and whitespace
         clean_text = clean_text.strip(" .,;:-")
@@ -359,16 +466,11 @@ class SentenceSkillExtractor:
         Returns:
             bool: True if likely technical, False otherwise
         """
-        # Check for technical-sounding terms in the skill name
-        technical_indicators = ["software", "programming", "development", "system", 
-                              "analysis", "database", "design", "implementation", 
-                              "architecture", "network", "security", "data", "code",
-                              "application", "platform", "framework", "language",
-                              "algorithm", "automation", "engineering", "technical"]
-        
-        for indicator in technical_indicators:
-            if indicator in skill_name.lower() or indicator in context.lower():
-                return True
+        # Check for technical-sounding terms in the skill name or context with
+        # one scan; no indicator contains a newline, so none spans the two
+        combined = skill_name.lower() + "\n" + context.lower()
+        if next(self._technical_automaton.iter(combined), None) is not None:
+            return True
         
         # Default to soft skill
         return False
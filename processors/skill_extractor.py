@@ -1,19 +1,61 @@
 import json
 import re
 import os
+import functools
 import spacy
+import ahocorasick
 import logging
 from collections import defaultdict
+from operator import itemgetter
 
-try:
-    # Try loading the language model for NER
-    nlp = spacy.load("en_core_web_md")
-except OSError:
-    # Fall back to a simpler model if the larger one isn't available
-    nlp = spacy.load("en_core_web_sm")
+# Only sentences and noun chunks are used, which need the parser and the
+# tagger/attribute_ruler POS tags; NER and lemmas are never read
+DISABLED_PIPES = ("ner", "lemmatizer")
+
+@functools.lru_cache(maxsize=1)
+def _get_nlp():
+    """
+    Load the spaCy model on first use, so importing this module stays cheap
+    
+    Returns:
+        spacy.language.Language: Loaded pipeline
+    """
+    try:
+        # Try loading the larger language model first
+        return spacy.load("en_core_web_md", disable=list(DISABLED_PIPES))
+    except OSError:
+        # Fall back to a simpler model if the larger one isn't available
+        return spacy.load("en_core_web_sm", disable=list(DISABLED_PIPES))
     
 logger = logging.getLogger('skill_extractor')
 
+class _PunctuationTable(dict):
+    r"""
+    str.translate table that deletes every character re.sub(r'[^\w\s]', '', ...)
+    would, filled in lazily per code point
+    """
+    
+    def __missing__(self, code):
+        """
+        Decide whether a code point is kept and remember the answer
+        
+        Args:
+            code (int): Code point being translated
+            
+        Returns:
+            int: The code point itself if it is a word or space character,
+                otherwise None to delete it
+        """
+        char = chr(code)
+        self[code] = value = code if (char.isalnum() or char == '_' or char.isspace()) else None
+        return value
+
+_STRIP_PUNCTUATION = _PunctuationTable()
+
+# Same, but turning the characters that end a part after a skill indicator
+# into spaces so the parts stay apart
+_SPLIT_PUNCTUATION = _PunctuationTable({ord(char): ord(' ') for char in ',;.'})
+
 class SkillExtractor:
     """
     Skill extractor that works with structured document formats
@@ -34,9 +76,36 @@ class SkillExtractor:
         # Prepare skill name variations
         self.skill_variations = self._prepare_skill_variations()
         
+        # Automaton over the variations, used to rule out text before parsing it
+        self._variation_automaton = ahocorasick.Automaton()
+        for variation, skill in self.skill_variations.items():
+            if variation:
+                self._variation_automaton.add_word(variation, (variation, skill))
+        self._variation_automaton.make_automaton()
+        
         # Regular expressions for skill detection
         self.skill_patterns = self._compile_skill_patterns()
         
+        # Delimiters between several skills on one line; table cells, word
+        # lines and OCR lines are not split on bullets
+        self._delimiter_re = re.compile(r'[,;|•·]')
+        self._cell_delimiter_re = re.compile(r'[,;|]')
+        
+        # The same lines and phrases recur across sections, so memoize matching
+        self._cached_skill_matches = functools.lru_cache(maxsize=4096)(self._find_skill_matches)
+        
+        # Phrases that introduce skills in a sentence, and an automaton that
+        # finds all of them in one pass
+        self.skill_indicators = ["proficient in", "experience with", "skilled in", "knowledge of", 
+                                 "expertise in", "familiar with", "worked with", "used"]
+        self._indicator_automaton = ahocorasick.Automaton()
+        for indicator in self.skill_indicators:
+            self._indicator_automaton.add_word(indicator, indicator)
+        self._indicator_automaton.make_automaton()
+        
+        # Phrases that rule a candidate out as a skill, matched in one pass
+        self._rejection_automaton = self._build_rejection_automaton()
+        
     def _load_skills_data(self, skills_db_path):
         """
         Load skills data from a JSON file
@@ -98,7 +167,7 @@ class SkillExtractor:
             
             # Add without punctuation, but be careful with C#
             # Don't add 'c' as a variation for C#
-            clean_skill = re.sub(r'[^\w\s]', '', skill)
+            clean_skill = skill.translate(_STRIP_PUNCTUATION)
             if clean_skill.lower() != skill.lower() and skill != "C#":
                 variations[clean_skill.lower()] = skill
                 
@@ -152,6 +221,79 @@ class SkillExtractor:
         
         return patterns
         
+    def _build_rejection_automaton(self):
+        """
+        Build an Aho-Corasick automaton over the phrases that disqualify a candidate
+        
+        Returns:
+            ahocorasick.Automaton: Maps each sentence indicator and non-skill
+                phrase to itself
+        """
+        # Sentence structures, which suggest a sentence rather than a skill
+        sentence_indicators = ['. ', '! ', '? ', ': ', '; ', ' and ', ' or ', ' but ', ' because ', ' when ', ' while ']
+        
+        # Common phrases that might be detected as skills but aren't
+        non_skill_phrases = [
+            "key skills", "core skills", "technical skills", "professional skills",
+            "soft skills", "hard skills", "primary skills", "skills include", 
+            "technologies into", "collaborated with", "curriculum enhancements",
+            "enhanced", "improved", "developed", "created", "implemented", "managed",
+            "led", "directed", "supervised", "assisted", "helped", "supported"
+        ]
+        
+        automaton = ahocorasick.Automaton()
+        for phrase in sentence_indicators + non_skill_phrases:
+            automaton.add_word(phrase, phrase)
+        automaton.make_automaton()
+        
+        return automaton
+        
+    def _may_contain_skill(self, text, word_starts=()):
+        """
+        Check whether any skill variation occurs in the text as a whole word
+        
+        Every skill match is a variation equal to a whole lowercased piece of
+        the text or one of its words, so a variation running into a letter or
+        digit on either side (the "r" in "work") cannot match and text without
+        any other occurrence can be skipped. Non-ASCII text always passes,
+        since lowercasing it can change how its pieces line up.
+        
+        Args:
+            text (str): Text to check
+            word_starts (collection, optional): Positions where a piece starts
+                even though a letter or digit precedes them
+            
+        Returns:
+            bool: False if the text cannot contain a skill, True otherwise
+        """
+        if not text.isascii():
+            return True
+            
+        lowered = text.lower()
+        last = len(lowered) - 1
+        for end, (variation, skill) in self._variation_automaton.iter(lowered):
+            start = end - len(variation) + 1
+            if start and lowered[start].isalnum() and lowered[start - 1].isalnum() and start not in word_starts:
+                continue
+            if end < last and lowered[end].isalnum() and lowered[end + 1].isalnum():
+                continue
+            return True
+            
+        return False
+        
+    def _keep_best_skills(self, best_skills, skills):
+        """
+        Merge newly extracted skills into the best entry seen for each name
+        
+        Args:
+            best_skills (dict): Skill name to its most confident entry so far
+            skills (list): Newly extracted skill dictionaries
+        """
+        for skill in skills:
+            current = best_skills.get(skill["name"])
+            if current is None or skill["confidence_score"] > current["confidence_score"]:
+                best_skills[skill["name"]] = skill
+                
     def extract_skills(self, structured_doc):
         """
         Extract skills from a structured document
@@ -162,8 +304,9 @@ class SkillExtractor:
         Returns:
             list: List of extracted skills with metadata
         """
-        extracted_skills = []
-        sections_with_skills = {}
+        # Best entry per skill name, updated as each extractor finishes
+        best_skills = {}
+        sections_with_skills = defaultdict(list)
         
         # Process based on document type
         doc_type = structured_doc.get("document_type", "unknown")
@@ -176,67 +319,66 @@ class SkillExtractor:
             if "skills" in sections:
                 skill_lines = sections["skills"]
                 skill_section_skills = self._extract_from_lines(skill_lines, "skills_section")
-                extracted_skills.extend(skill_section_skills)
+                self._keep_best_skills(best_skills, skill_section_skills)
                 sections_with_skills["skills_section"] = skill_section_skills
                 
             # Extract from summary sections
             if "summary" in sections:
                 summary_lines = sections["summary"]
                 summary_skills = self._extract_from_lines(summary_lines, "summary")
-                extracted_skills.extend(summary_skills)
+                self._keep_best_skills(best_skills, summary_skills)
                 sections_with_skills["summary"] = summary_skills
                 
             # For resumes, also extract from experience sections
             if doc_type == "resume" and "experience" in sections:
                 experience_lines = sections["experience"]
                 experience_skills = self._extract_from_lines(experience_lines, "experience")
-                extracted_skills.extend(experience_skills)
+                self._keep_best_skills(best_skills, experience_skills)
                 sections_with_skills["experience"] = experience_skills
             
             # For certifications, focus on the certification content
             if doc_type == "certification" and "certifications" in sections:
                 cert_lines = sections["certifications"]
                 cert_skills = self._extract_from_lines(cert_lines, "certification_content")
-                extracted_skills.extend(cert_skills)
+                self._keep_best_skills(best_skills, cert_skills)
                 sections_with_skills["certification_content"] = cert_skills
         
         # Next, process layout-based extraction for PDF
         if "pages" in structured_doc:
+            # Group the tables by page once instead of rescanning them per page
+            has_tables = "tables" in structured_doc.get("structure", {})
+            tables_by_page = defaultdict(list)
+            if has_tables:
+                for table in structured_doc["structure"]["tables"]:
+                    tables_by_page[table["page"]].append(table)
+                    
             for page in structured_doc["pages"]:
                 # Process tables which often contain skills
-                if "tables" in structured_doc.get("structure", {}):
-                    for table in structured_doc["structure"]["tables"]:
-                        if table["page"] == page["number"]:
-                            table_skills = self._extract_from_table(table, "table_content")
-                            extracted_skills.extend(table_skills)
-                            if "table_content" not in sections_with_skills:
-                                sections_with_skills["table_content"] = []
-                            sections_with_skills["table_content"].extend(table_skills)
+                if has_tables:
+                    for table in tables_by_page.get(page["number"], []):
+                        table_skills = self._extract_from_table(table, "table_content")
+                        self._keep_best_skills(best_skills, table_skills)
+                        sections_with_skills["table_content"].extend(table_skills)
                 
                 # Process words with positions for layout-aware extraction
                 if "words" in page:
                     words_skills = self._extract_from_positioned_words(page["words"], "positioned_content")
-                    extracted_skills.extend(words_skills)
-                    if "positioned_content" not in sections_with_skills:
-                        sections_with_skills["positioned_content"] = []
+                    self._keep_best_skills(best_skills, words_skills)
                     sections_with_skills["positioned_content"].extend(words_skills)
         
         # For image-based documents, try OCR layout information
         if "layout" in structured_doc:
             layout_skills = self._extract_from_ocr_layout(structured_doc["layout"], "ocr_layout")
-            extracted_skills.extend(layout_skills)
+            self._keep_best_skills(best_skills, layout_skills)
             sections_with_skills["ocr_layout"] = layout_skills
         
         # Finally, use NLP-based extraction on the raw text as a fallback
         if "raw_text" in structured_doc:
             nlp_skills = self._extract_with_nlp(structured_doc["raw_text"], "nlp_extraction")
-            extracted_skills.extend(nlp_skills)
+            self._keep_best_skills(best_skills, nlp_skills)
             sections_with_skills["nlp_extraction"] = nlp_skills
             
-        # Deduplicate skills while preserving the highest confidence and metadata
-        deduplicated_skills = self._deduplicate_skills(extracted_skills)
-        
-        return deduplicated_skills, sections_with_skills
+        return list(best_skills.values()), dict(sections_with_skills)
         
     def _extract_from_lines(self, lines, source):
         """
@@ -251,6 +393,8 @@ class SkillExtractor:
         """
         extracted_skills = []
         
+        # First pass: clean the lines and see which ones need NLP
+        pending = []
         for line in lines:
             # Clean the line
             clean_line = line.strip()
@@ -262,8 +406,23 @@ class SkillExtractor:
             if len(clean_line.split()) <= 3 and any(header in clean_line.lower() for header in common_headers):
                 continue
                 
-            # Check if the line itself is a skill
             skill_match = self._match_skill(clean_line)
+            has_delimiter = self._delimiter_re.search(clean_line) is not None
+            
+            # Lines left for NLP only yield skills that occur in them as whole words,
+            # so skip parsing the ones without any skill variation
+            if not skill_match and not has_delimiter and not self._may_contain_skill(clean_line):
+                continue
+                
+            pending.append((clean_line, skill_match, has_delimiter))
+        
+        # Parse every line without a direct match or delimiters in one batch
+        nlp_lines = [clean_line for clean_line, skill_match, has_delimiter in pending
+                     if not skill_match and not has_delimiter]
+        docs = iter(_get_nlp().pipe(nlp_lines, batch_size=32) if nlp_lines else ())
+        
+        for clean_line, skill_match, has_delimiter in pending:
+            # Check if the line itself is a skill
             if skill_match:
                 for skill in skill_match:
                     # Extra verification: ensure this is a known skill or short phrase
@@ -278,43 +437,41 @@ class SkillExtractor:
                 
             # Check for skills in the line
             # First, try to split by common delimiters
-            if any(delim in clean_line for delim in [',', ';', '|', '•', '·']):
-                # Split by delimiters and check each part
-                for delimiter in [',', ';', '|', '•', '·']:
-                    if delimiter in clean_line:
-                        parts = [p.strip() for p in clean_line.split(delimiter)]
-                        for part in parts:
-                            if not part:
-                                continue
-                            
-                            # Skip if part is too long (likely a sentence, not a skill)
-                            if len(part.split()) > 5:  # Reduced from 7 to 5 words
-                                continue
-                                
-                            # Skip if part contains sentence structures
-                            sentence_indicators = ['. ', '! ', '? ', ': ', '; ', ' and ', ' or ', ' but ', ' because ', ' when ', ' while ']
-                            if any(indicator in part.lower() for indicator in sentence_indicators):
-                                continue
-                            
-                            # Skip common phrases that aren't skills
-                            non_skill_phrases = ["key", "main", "primary", "essential", "required", "preferred", "demonstrated", "proven"]
-                            if len(part.split()) == 1 and part.lower() in non_skill_phrases:
-                                continue
-                                
-                            skill_match = self._match_skill(part)
-                            if skill_match:
-                                for skill in skill_match:
-                                    # Extra verification: ensure this is a known skill or short phrase
-                                    if skill in self.technical_skills or skill in self.soft_skills or len(skill.split()) <= 2:
-                                        extracted_skills.append({
-                                            "name": skill,
-                                            "confidence_score": 0.8,
-                                            "source": source,
-                                            "context": clean_line
-                                        })
+            if has_delimiter:
+                # Split on every delimiter at once and check each part
+                parts = [p.strip() for p in self._delimiter_re.split(clean_line)]
+                for part in parts:
+                    if not part:
+                        continue
+                    
+                    # Skip if part is too long (likely a sentence, not a skill)
+                    if len(part.split()) > 5:  # Reduced from 7 to 5 words
+                        continue
+                        
+                    # Skip if part contains sentence structures
+                    sentence_indicators = ['. ', '! ', '? ', ': ', '; ', ' and ', ' or ', ' but ', ' because ', ' when ', ' while ']
+                    if any(indicator in part.lower() for indicator in sentence_indicators):
+                        continue
+                    
+                    # Skip common phrases that aren't skills
+                    non_skill_phrases = ["key", "main", "primary", "essential", "required", "preferred", "demonstrated", "proven"]
+                    if len(part.split()) == 1 and part.lower() in non_skill_phrases:
+                        continue
+                        
+                    skill_match = self._match_skill(part)
+                    if skill_match:
+                        for skill in skill_match:
+                            # Extra verification: ensure this is a known skill or short phrase
+                            if skill in self.technical_skills or skill in self.soft_skills or len(skill.split()) <= 2:
+                                extracted_skills.append({
+                                    "name": skill,
+                                    "confidence_score": 0.8,
+                                    "source": source,
+                                    "context": clean_line
+                                })
             else:
-                # Apply NLP to extract potential skill entities
-                doc = nlp(clean_line)
+                # Use the parsed line to extract potential skill entities
+                doc = next(docs)
                 
                 # Look for noun phrases that might be skills
                 for chunk in doc.noun_chunks:
@@ -408,31 +565,31 @@ class SkillExtractor:
                         # Check if the cell content is a skill
                         skill_match = self._match_skill(clean_cell)
                         if skill_match:
-                            extracted_skills.append({
-                                "name": skill_match,
-                                "confidence_score": 0.9,  # High confidence for skills in tables
-                                "source": source,
-                                "context": f"Table cell: {clean_cell}"
-                            })
+                            for skill in skill_match:
+                                extracted_skills.append({
+                                    "name": skill,
+                                    "confidence_score": 0.9,  # High confidence for skills in tables
+                                    "source": source,
+                                    "context": f"Table cell: {clean_cell}"
+                                })
                             continue
                             
                         # Check for skills in the cell content
-                        if any(delim in clean_cell for delim in [',', ';', '|']):
-                            # Split by delimiters and check each part
-                            for delimiter in [',', ';', '|']:
-                                if delimiter in clean_cell:
-                                    parts = [p.strip() for p in clean_cell.split(delimiter)]
-                                    for part in parts:
-                                        if not part:
-                                            continue
-                                        skill_match = self._match_skill(part)
-                                        if skill_match:
-                                            extracted_skills.append({
-                                                "name": skill_match,
-                                                "confidence_score": 0.85,
-                                                "source": source,
-                                                "context": f"Table cell: {clean_cell}"
-                                            })
+                        if self._cell_delimiter_re.search(clean_cell):
+                            # Split on every delimiter at once and check each part
+                            parts = [p.strip() for p in self._cell_delimiter_re.split(clean_cell)]
+                            for part in parts:
+                                if not part:
+                                    continue
+                                skill_match = self._match_skill(part)
+                                if skill_match:
+                                    for skill in skill_match:
+                                        extracted_skills.append({
+                                            "name": skill,
+                                            "confidence_score": 0.85,
+                                            "source": source,
+                                            "context": f"Table cell: {clean_cell}"
+                                        })
         
         return extracted_skills
         
@@ -454,14 +611,15 @@ class SkillExtractor:
         
         for word in words:
             if "top" in word:
-                # Round to the nearest multiple of 5 to group words in the same line
+                # Round to the nearest multiple of 5 to group words in the same line,
+                # keeping only the x-position and text read once from each word
                 y_key = round(word["top"] / 5) * 5
-                lines_by_y[y_key].append(word)
+                lines_by_y[y_key].append((word.get("x0", 0), word.get("text", "")))
         
         # Sort each line by x-position and create line text
         for y_key, line_words in lines_by_y.items():
-            sorted_words = sorted(line_words, key=lambda w: w.get("x0", 0))
-            line_text = " ".join(w.get("text", "") for w in sorted_words)
+            sorted_words = sorted(line_words, key=itemgetter(0))
+            line_text = " ".join(text for _, text in sorted_words)
             
             # Skip empty lines
             if not line_text.strip():
@@ -470,31 +628,31 @@ class SkillExtractor:
             # Check if the line is a skill or contains skills
             skill_match = self._match_skill(line_text)
             if skill_match:
-                extracted_skills.append({
-                    "name": skill_match,
-                    "confidence_score": 0.8,
-                    "source": source,
-                    "context": line_text
-                })
+                for skill in skill_match:
+                    extracted_skills.append({
+                        "name": skill,
+                        "confidence_score": 0.8,
+                        "source": source,
+                        "context": line_text
+                    })
                 continue
                 
             # Check for skills in the line
-            if any(delim in line_text for delim in [',', ';', '|']):
-                # Split by delimiters and check each part
-                for delimiter in [',', ';', '|']:
-                    if delimiter in line_text:
-                        parts = [p.strip() for p in line_text.split(delimiter)]
-                        for part in parts:
-                            if not part:
-                                continue
-                            skill_match = self._match_skill(part)
-                            if skill_match:
-                                extracted_skills.append({
-                                    "name": skill_match,
-                                    "confidence_score": 0.75,
-                                    "source": source,
-                                    "context": line_text
-                                })
+            if self._cell_delimiter_re.search(line_text):
+                # Split on every delimiter at once and check each part
+                parts = [p.strip() for p in self._cell_delimiter_re.split(line_text)]
+                for part in parts:
+                    if not part:
+                        continue
+                    skill_match = self._match_skill(part)
+                    if skill_match:
+                        for skill in skill_match:
+                            extracted_skills.append({
+                                "name": skill,
+                                "confidence_score": 0.75,
+                                "source": source,
+                                "context": line_text
+                            })
         
         return extracted_skills
         
@@ -546,31 +704,31 @@ class SkillExtractor:
             # Check if the line itself is a skill
             skill_match = self._match_skill(clean_line)
             if skill_match:
-                extracted_skills.append({
-                    "name": skill_match,
-                    "confidence_score": 0.75,  # Lower confidence for OCR results
-                    "source": source,
-                    "context": clean_line
-                })
+                for skill in skill_match:
+                    extracted_skills.append({
+                        "name": skill,
+                        "confidence_score": 0.75,  # Lower confidence for OCR results
+                        "source": source,
+                        "context": clean_line
+                    })
                 continue
                 
             # Check for skills in the line
-            if any(delim in clean_line for delim in [',', ';', '|']):
-                # Split by delimiters and check each part
-                for delimiter in [',', ';', '|']:
-                    if delimiter in clean_line:
-                        parts = [p.strip() for p in clean_line.split(delimiter)]
-                        for part in parts:
-                            if not part:
-                                continue
-                            skill_match = self._match_skill(part)
-                            if skill_match:
-                                extracted_skills.append({
-                                    "name": skill_match,
-                                    "confidence_score": 0.7,
-                                    "source": source,
-                                    "context": clean_line
-                                })
+            if self._cell_delimiter_re.search(clean_line):
+                # Split on every delimiter at once and check each part
+                parts = [p.strip() for p in self._cell_delimiter_re.split(clean_line)]
+                for part in parts:
+                    if not part:
+                        continue
+                    skill_match = self._match_skill(part)
+                    if skill_match:
+                        for skill in skill_match:
+                            extracted_skills.append({
+                                "name": skill,
+                                "confidence_score": 0.7,
+                                "source": source,
+                                "context": clean_line
+                            })
         
         return extracted_skills
         
@@ -591,60 +749,92 @@ class SkillExtractor:
         if not text.strip():
             return extracted_skills
             
+        # Skip parsing if no skill variation occurs in the text, either as is or
+        # with punctuation removed as the indicator parts are below; those parts
+        # start right after an indicator, even in the middle of a word
+        split_text = text.translate(_SPLIT_PUNCTUATION)
+        if not self._may_contain_skill(text):
+            tail_starts = {end + 1 for end, indicator in self._indicator_automaton.iter(split_text.lower())}
+            if not self._may_contain_skill(split_text, tail_starts):
+                return extracted_skills
+            
         # Process with spaCy
-        doc = nlp(text)
+        doc = _get_nlp()(text)
         
-        # Look for noun phrases that might be skills
-        for chunk in doc.noun_chunks:
-            skill_match = self._match_skill(chunk.text)
-            if skill_match:
-                extracted_skills.append({
-                    "name": skill_match,
-                    "confidence_score": 0.6,  # Lower confidence for NLP extraction
-                    "source": source,
-                    "context": chunk.sent.text if hasattr(chunk, 'sent') else ""
-                })
+        # Look for noun phrases that might be skills, sentence by sentence so
+        # each sentence's text is only built once
+        for sent in doc.sents:
+            sent_text = sent.text
+            for chunk in sent.noun_chunks:
+                skill_match = self._match_skill(chunk.text)
+                if skill_match:
+                    for skill in skill_match:
+                        extracted_skills.append({
+                            "name": skill,
+                            "confidence_score": 0.6,  # Lower confidence for NLP extraction
+                            "source": source,
+                            "context": sent_text
+                        })
         
         # Extract skills from sentences with skill indicators
-        skill_indicators = ["proficient in", "experience with", "skilled in", "knowledge of", 
-                           "expertise in", "familiar with", "worked with", "used"]
-                           
         for sent in doc.sents:
             sent_text = sent.text.lower()
             
-            for indicator in skill_indicators:
-                if indicator in sent_text:
+            # Find where each indicator first ends with a single scan
+            first_ends = {}
+            for end, indicator in self._indicator_automaton.iter(sent_text):
+                first_ends.setdefault(indicator, end)
+                
+            for indicator in self.skill_indicators:
+                if indicator in first_ends:
                     # Extract the part after the indicator
-                    parts = sent_text.split(indicator, 1)
-                    if len(parts) > 1:
-                        after_part = parts[1]
-                        
-                        # Check for comma-separated skills
-                        skill_parts = [p.strip() for p in re.split(r'[,;]', after_part)]
+                    after_part = sent_text[first_ends[indicator] + 1:]
+                    
+                    # Every part below is a piece of the tail with punctuation
+                    # removed, so a tail without any variation has no skills
+                    if not self._may_contain_skill(after_part.translate(_SPLIT_PUNCTUATION)):
+                        continue
                         
-                        for part in skill_parts:
-                            # Stop at end of sentence or another indicator
-                            if "." in part:
-                                part = part.split(".", 1)[0]
-                                
-                            # Clean up and match skill
-                            clean_part = re.sub(r'[^\w\s]', '', part).strip()
-                            skill_match = self._match_skill(clean_part)
+                    # Check for comma-separated skills
+                    skill_parts = [p.strip() for p in re.split(r'[,;]', after_part)]
+                    
+                    for part in skill_parts:
+                        # Stop at end of sentence or another indicator
+                        if "." in part:
+                            part = part.split(".", 1)[0]
                             
-                            if skill_match:
+                        # Clean up and match skill
+                        clean_part = part.translate(_STRIP_PUNCTUATION).strip()
+                        skill_match = self._match_skill(clean_part)
+                        
+                        if skill_match:
+                            for skill in skill_match:
                                 extracted_skills.append({
-                                    "name": skill_match,
+                                    "name": skill,
                                     "confidence_score": 0.65,
                                     "source": source,
                                     "context": sent.text
                                 })
-        
+    
         return extracted_skills
         
     def _match_skill(self, text):
         """
         Match a skill in the given text
         
+        Args:
+            text (str): Text to match skills in
+            
+        Returns:
+            list: List of matched skills
+        """
+        # Copy the cached result so callers never share it
+        return list(self._cached_skill_matches(text))
+        
+    def _find_skill_matches(self, text):
+        """
+        Find the skills matched by the given text, uncached
+        
         Args:
             text (str): Text to match skills in
             
@@ -664,21 +854,9 @@ class SkillExtractor:
         if len(clean_text.split()) > 5:  # Reduced from 7 to 5 for stricter filtering
             return matched_skills
             
-        # Skip if text contains sentence structures
-        sentence_indicators = ['. ', '! ', '? ', ': ', '; ', ' and ', ' or ', ' but ', ' because ', ' when ', ' while ']
-        if any(indicator in clean_text for indicator in sentence_indicators):
-            return matched_skills
-            
-        # Skip common phrases that might be detected as skills but aren't
-        non_skill_phrases = [
-            "key skills", "core skills", "technical skills", "professional skills",
-            "soft skills", "hard skills", "primary skills", "skills include", 
-            "technologies into", "collaborated with", "curriculum enhancements",
-            "enhanced", "improved", "developed", "created", "implemented", "managed",
-            "led", "directed", "supervised", "assisted", "helped", "supported"
-        ]
-        
-        if any(phrase in clean_text for phrase in non_skill_phrases):
+        # Skip if text contains sentence structures or common non-skill phrases,
+        # found with a single scan
+        if next(self._rejection_automaton.iter(clean_text), None) is not None:
             return matched_skills
             
         # Skip if text starts with a verb (likely an action, not a skill)
@@ -733,27 +911,6 @@ class SkillExtractor:
         
         return list(set(matched_skills))  # Remove duplicates
         
-    def _deduplicate_skills(self, skills):
-        """
-        Deduplicate skills while preserving the highest confidence and metadata
-        
-        Args:
-            skills (list): List of skill dictionaries
-            
-        Returns:
-            list: Deduplicated skills
-        """
-        skill_map = {}
-        
-        for skill in skills:
-            skill_name = skill["name"]
-            confidence = skill["confidence_score"]
-            
-            if skill_name not in skill_map or confidence > skill_map[skill_name]["confidence_score"]:
-                skill_map[skill_name] = skill
-                
-        return list(skill_map.values())
-
     def _extract_with_patterns(self, resume_text, source):
         """
         Extract skills using regex patterns
@@ -1,5 +1,6 @@
 import re
 import logging
+import ahocorasick
 from typing import List, Dict, Any, Optional
 from utils.skill_database import SkillDatabase
 
@@ -64,6 +65,43 @@ class SkillValidator:
         # Compile the patterns
         self.compiled_patterns = [re.compile(pattern) for pattern in self.invalid_patterns]
         
+        # Special exception for known technical terms - always allow these
+        self.technical_exceptions = [
+            "database management", "database systems", "database management systems", 
+            "systems database management", "relational databases", "data modeling", 
+            "version control", "data analysis", "data mining", "machine learning",
+            "artificial intelligence", "natural language processing", "computer vision",
+            "cloud computing", "distributed systems", "operating systems", "networking",
+            "cyber security", "information security", "web development", "mobile development",
+            "software engineering", "devops", "continuous integration", "continuous deployment"
+        ]
+        
+        # Sentence-like structures that suggest a phrase rather than a skill
+        self.sentence_indicators = [". ", "! ", "? ", ": ", "; ", " and ", " or ", " but ", " because ", " when ", " while "]
+        
+        # One automaton over all three phrase lists, mapping each phrase to
+        # whether it is a technical exception
+        self._phrase_automaton = self._build_phrase_automaton()
+        
+    def _build_phrase_automaton(self):
+        """
+        Build an Aho-Corasick automaton over the invalid, sentence and exception phrases
+        
+        Returns:
+            ahocorasick.Automaton: Maps each phrase to True for a technical
+                exception and False for an invalid phrase
+        """
+        automaton = ahocorasick.Automaton()
+        for phrase in self.invalid_skills + self.sentence_indicators:
+            automaton.add_word(phrase, False)
+            
+        # Exceptions are added last, since any exception overrides the rest
+        for phrase in self.technical_exceptions:
+            automaton.add_word(phrase, True)
+        automaton.make_automaton()
+        
+        return automaton
+        
     def validate_skills(self, skills: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Validate and clean extracted skills
@@ -131,24 +169,16 @@ class SkillValidator:
         # Convert to lowercase for comparison
         name_lower = skill_name.lower()
         
-        # Special exception for known technical terms - always allow these
-        technical_exceptions = [
-            "database management", "database systems", "database management systems", 
-            "systems database management", "relational databases", "data modeling", 
-            "version control", "data analysis", "data mining", "machine learning",
-            "artificial intelligence", "natural language processing", "computer vision",
-            "cloud computing", "distributed systems", "operating systems", "networking",
-            "cyber security", "information security", "web development", "mobile development",
-            "software engineering", "devops", "continuous integration", "continuous deployment"
-        ]
-        
-        if any(exception in name_lower for exception in technical_exceptions):
-            return False
-        
-        # Check against the list of invalid skills
-        for invalid_skill in self.invalid_skills:
-            if invalid_skill in name_lower:
-                return True
+        # Scan for technical exceptions, invalid skills and sentence-like
+        # structures at once; a known technical term always allows the skill
+        has_invalid_phrase = False
+        for _, is_exception in self._phrase_automaton.iter(name_lower):
+            if is_exception:
+                return False
+            has_invalid_phrase = True
+            
+        if has_invalid_phrase:
+            return True
                 
         # Check against regex patterns
         for pattern in self.compiled_patterns:
@@ -160,11 +190,6 @@ class SkillValidator:
         if len(words) > 4:  # Too many words is likely a phrase, not a skill
             return True
             
-        # Check for sentence-like structures
-        sentence_indicators = [". ", "! ", "? ", ": ", "; ", " and ", " or ", " but ", " because ", " when ", " while "]
-        if any(indicator in name_lower for indicator in sentence_indicators):
-            return True
-            
         return False
         
     def clean_skill_name(self, skill_name: str) -> str:
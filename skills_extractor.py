@@ -10,12 +10,11 @@ for skills that are backed by certifications.
 
 import os
 import sys
-import json
+import orjson
 import argparse
 import logging
 import glob
 import re
-from extract_and_process import DocumentProcessor, SkillProcessor, ProficiencyCalculator
 
 # Configure logging
 logging.basicConfig(
@@ -35,6 +34,10 @@ def extract_skills(input_path, output_path=None, tesseract_path=None):
         output_path (str, optional): Path to output JSON file
         tesseract_path (str, optional): Path to Tesseract OCR executable
     """
+    # Import the processing pipeline lazily so that `--help` and argument
+    # errors don't pay for loading spaCy, pdfplumber and pytesseract
+    from extract_and_process import DocumentProcessor, SkillProcessor, ProficiencyCalculator, detect_industry
+    
     # Initialize processors
     document_processor = DocumentProcessor(tesseract_path)
     skill_processor = SkillProcessor()
@@ -46,7 +49,7 @@ def extract_skills(input_path, output_path=None, tesseract_path=None):
     
     # Check if input path exists
     if not os.path.exists(input_path):
-        logger.error(f"Input path does not exist: {input_path}")
+        logger.error("Input path does not exist: %s", input_path)
         return False
     
     # If input is a directory, process all files
@@ -58,27 +61,31 @@ def extract_skills(input_path, output_path=None, tesseract_path=None):
             files.extend(glob.glob(os.path.join(input_path, pattern)))
         
         if not files:
-            logger.error(f"No supported files found in directory: {input_path}")
+            logger.error("No supported files found in directory: %s", input_path)
             return False
         
-        # Categorize files
-        resume_files = [f for f in files if document_processor.is_resume(f)]
-        cert_files = [f for f in files if document_processor.is_certification(f)]
+        # Categorize files in a single pass
+        file_buckets = {'resumes': [], 'certifications': [], 'unknown': []}
+        for category, file_path in document_processor.categorize_files(files):
+            file_buckets[category].append(file_path)
+        
+        resume_files = file_buckets['resumes']
+        cert_files = file_buckets['certifications']
         
-        logger.info(f"Found {len(resume_files)} resume files and {len(cert_files)} certification files")
+        logger.info("Found %s resume files and %s certification files", len(resume_files), len(cert_files))
         
         # Process certification files first to get skills
         cert_skills = []
         cert_texts = {}
         
         for file_path in cert_files:
-            logger.info(f"Processing certification: {os.path.basename(file_path)}")
+            logger.info("Processing certification: %s", os.path.basename(file_path))
             
             # Extract text
             extracted_text = document_processor.process_file(file_path)
             
             if not extracted_text:
-                logger.warning(f"Failed to extract text from {file_path}")
+                logger.warning("Failed to extract text from %s", file_path)
                 continue
             
             # Store certification text for context
@@ -86,7 +93,7 @@ def extract_skills(input_path, output_path=None, tesseract_path=None):
             
             # Extract skills
             file_skills = skill_processor.extract_skills(extracted_text)
-            logger.info(f"Extracted {len(file_skills)} skills from certification")
+            logger.info("Extracted %s skills from certification", len(file_skills))
             cert_skills.extend(file_skills)
         
         # Now process resume files
@@ -96,20 +103,19 @@ def extract_skills(input_path, output_path=None, tesseract_path=None):
         industry_scores = {}
         
         for file_path in resume_files:
-            logger.info(f"Processing resume: {os.path.basename(file_path)}")
+            logger.info("Processing resume: %s", os.path.basename(file_path))
             resume_file = os.path.basename(file_path)
             
             # Extract text
             extracted_text = document_processor.process_file(file_path)
             
             if not extracted_text:
-                logger.warning(f"Failed to extract text from {file_path}")
+                logger.warning("Failed to extract text from %s", file_path)
                 continue
             
             # Detect industry for targeted skill extraction
-            from extract_and_process import detect_industry
             detected_industry, industry_scores = detect_industry(extracted_text)
-            logger.info(f"Detected industry: {detected_industry}")
+            logger.info("Detected industry: %s", detected_industry)
             
             # Update processors for industry-specific extraction
             if hasattr(skill_processor, 'update_for_industry'):
@@ -120,14 +126,14 @@ def extract_skills(input_path, output_path=None, tesseract_path=None):
             
             # Extract skills using industry context
             resume_skills = skill_processor.extract_skills(extracted_text)
-            logger.info(f"Extracted {len(resume_skills)} skills from resume (industry: {detected_industry})")
+            logger.info("Extracted %s skills from resume (industry: %s)", len(resume_skills), detected_industry)
             
             # Mark backed skills
             backed_skills = skill_processor.mark_backed_skills(resume_skills, cert_skills)
             
             # Count backed skills
             backed_count = sum(1 for skill in backed_skills if skill.get("is_backed", False))
-            logger.info(f"Marked {backed_count} skills as backed by certifications")
+            logger.info("Marked %s skills as backed by certifications", backed_count)
             
             # Process skills with proficiency levels
             processed_skills = []
@@ -138,7 +144,7 @@ def extract_skills(input_path, output_path=None, tesseract_path=None):
                 explicit_mention = re.search(r'\b' + re.escape(skill_name) + r'\b', extracted_text, re.IGNORECASE)
                 
                 if not explicit_mention:
-                    logger.warning(f"Skipping skill {skill_name} - not explicitly mentioned in text")
+                    logger.warning("Skipping skill %s - not explicitly mentioned in text", skill_name)
                     continue
                     
                 # Special validation for potentially ambiguous skills
@@ -153,7 +159,7 @@ def extract_skills(input_path, output_path=None, tesseract_path=None):
                     ])
                     
                     if not programming_context:
-                        logger.warning(f"Skipping ambiguous skill {skill_name} - not in proper context")
+                        logger.warning("Skipping ambiguous skill %s - not in proper context", skill_name)
                         continue
                     
                 # Get certification text for this skill if available
@@ -197,12 +203,12 @@ def extract_skills(input_path, output_path=None, tesseract_path=None):
             }
             
             try:
-                with open(output_path, 'w') as f:
-                    json.dump(results, f, indent=2)
-                logger.info(f"Results saved to {output_path}")
+                with open(output_path, 'wb') as f:
+                    f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+                logger.info("Results saved to %s", output_path)
                 return True
             except Exception as e:
-                logger.error(f"Error saving results: {str(e)}")
+                logger.error("Error saving results: %s", e)
                 return False
         else:
             logger.error("No resume file was processed")
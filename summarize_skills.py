@@ -19,6 +19,17 @@ PROFICIENCY_DESCRIPTIONS = {
     "Expert": "Comprehensive mastery and leadership in the subject"
 }
 
+# Keywords used to pick out industry-specific skills for the detected industry
+INDUSTRY_SKILL_KEYWORDS = {
+    "technology": ["programming", "development", "software", "database", "cloud", "devops"],
+    "healthcare": ["patient", "medical", "clinical", "health", "diagnosis", "treatment"],
+    "finance": ["financial", "accounting", "banking", "investment", "budget", "analysis"],
+    "education": ["teaching", "curriculum", "instruction", "assessment", "learning"],
+    "legal": ["legal", "law", "contracts", "compliance", "regulation"],
+    "marketing": ["marketing", "brand", "digital", "content", "campaign"],
+    "sales": ["sales", "account", "business development", "client", "revenue"]
+}
+
 def load_skills(json_file):
     """Load skills data from a JSON file"""
     try:
@@ -35,18 +46,33 @@ def generate_summary(skills_data, output_file=None):
         print("No skills data available")
         return
     
-    # Organize skills by proficiency level
-    skills_by_level = {level: [] for level in ["Expert", "Advanced", "Intermediate", "Beginner"]}
+    # Organize skills by proficiency level, split into technical and soft skills
+    skills_by_level = {level: ([], []) for level in ["Expert", "Advanced", "Intermediate", "Beginner"]}
+    
+    # Keywords for the industry-specific section, if an industry was detected
+    industry = skills_data.get("industry", "general")
+    industry_keywords = INDUSTRY_SKILL_KEYWORDS.get(industry, []) if industry != "general" else []
+    industry_specific_skills = []
     
     # Count backed vs unbacked skills
     backed_count = 0
     total_skills = len(skills_data.get("skills", []))
     
+    # Single pass over the skills: bucket by level and type, count backed skills
+    # and collect industry-specific skills
     for skill in skills_data.get("skills", []):
         proficiency = skill.get("proficiency", "Beginner")
-        skills_by_level[proficiency].append(skill)
+        technical_skills, soft_skills = skills_by_level[proficiency]
+        if skill.get("is_technical", True):
+            technical_skills.append(skill)
+        else:
+            soft_skills.append(skill)
         if skill.get("is_backed", False):
             backed_count += 1
+        if industry_keywords:
+            skill_name = skill["name"].lower()
+            if any(keyword in skill_name for keyword in industry_keywords):
+                industry_specific_skills.append(skill)
     
     # Generate summary text
     summary = []
@@ -81,15 +107,12 @@ def generate_summary(skills_data, output_file=None):
     # Skills by proficiency
     summary.append("\n## Skills by Proficiency\n")
     for level in ["Expert", "Advanced", "Intermediate", "Beginner"]:
-        level_skills = skills_by_level[level]
-        if level_skills:
-            summary.append(f"\n### {level} ({len(level_skills)})\n")
+        technical_skills, soft_skills = skills_by_level[level]
+        level_count = len(technical_skills) + len(soft_skills)
+        if level_count:
+            summary.append(f"\n### {level} ({level_count})\n")
             summary.append(f"_{PROFICIENCY_DESCRIPTIONS[level]}_\n\n")
             
-            # Group skills into technical and soft skills
-            technical_skills = [s for s in level_skills if s.get("is_technical", True)]
-            soft_skills = [s for s in level_skills if not s.get("is_technical", True)]
-            
             if technical_skills:
                 summary.append("**Technical Skills:**\n")
                 for skill in technical_skills:
@@ -104,28 +127,6 @@ def generate_summary(skills_data, output_file=None):
     
     # Add industry-specific section if industry is detected
     if "industry" in skills_data and skills_data["industry"] != "general":
-        industry = skills_data["industry"]
-        industry_specific_skills = []
-        
-        # Define industry-specific skill keywords
-        industry_skill_keywords = {
-            "technology": ["programming", "development", "software", "database", "cloud", "DevOps"],
-            "healthcare": ["patient", "medical", "clinical", "health", "diagnosis", "treatment"],
-            "finance": ["financial", "accounting", "banking", "investment", "budget", "analysis"],
-            "education": ["teaching", "curriculum", "instruction", "assessment", "learning"],
-            "legal": ["legal", "law", "contracts", "compliance", "regulation"],
-            "marketing": ["marketing", "brand", "digital", "content", "campaign"],
-            "sales": ["sales", "account", "business development", "client", "revenue"]
-        }
-        
-        # Find industry-specific skills
-        if industry in industry_skill_keywords:
-            keywords = industry_skill_keywords[industry]
-            for skill in skills_data.get("skills", []):
-                skill_name = skill["name"].lower()
-                if any(keyword.lower() in skill_name for keyword in keywords):
-                    industry_specific_skills.append(skill)
-        
         # Add industry-specific skills section if any found
         if industry_specific_skills:
             summary.append(f"\n## {industry.title()} Industry Skills\n")
@@ -68,5 +68,29 @@ def test_sentence_extraction():
             technical = "Technical" if skill.get("is_technical", False) else "Soft"
             print(f"- {skill['name']} ({technical}, Confidence: {confidence:.2f})")
 
+def test_separator_split():
+    """Test that skill lists split cleanly on commas, semicolons and 'and'"""
+    skills_db_path = os.path.join(os.path.dirname(__file__), 'data', 'skills_database.json')
+    extractor = SentenceSkillExtractor(skills_db_path)
+    
+    # Lists with an Oxford comma must not leave "and" on the last skill
+    examples = {
+        "Python, Java, and SQL": ["Python", "Java", "SQL"],
+        "Docker, Kubernetes, and AWS": ["Docker", "Kubernetes", "AWS"],
+        "Python, Java; SQL and Docker": ["Python", "Java", "SQL", "Docker"],
+        "Python and SQL": ["Python", "SQL"]
+    }
+    
+    print("\nSeparator splits:")
+    for skill_text, expected in examples.items():
+        parts = extractor._separator_re.split(skill_text)
+        print(f"- {skill_text}: {parts}")
+        assert parts == expected, skill_text
+        
+    # The last skill of an Oxford-comma list still gets its database match
+    skills = extractor._extract_with_patterns("Proficient in Python, Java, and SQL")
+    assert [skill["name"] for skill in skills] == ["Python", "Java", "SQL"]
+
 if __name__ == "__main__":
-    test_sentence_extraction() 
\ No newline at end of file
+    test_sentence_extraction()
+    test_separator_split() 
\ No newline at end of file
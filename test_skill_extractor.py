@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Test script for the SkillExtractor module
+"""
+
+import logging
+from processors.skill_extractor import SkillExtractor
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('test_skill_extractor')
+
+def test_prose_prefilter():
+    """Test that plain prose lines are ruled out before parsing"""
+    extractor = SkillExtractor()
+    
+    # Lines where short variations such as "r", "c" and "go" only occur inside words
+    prose_lines = [
+        "Worked on the quarterly budget",
+        "Hello world",
+        "Bachelor of Science in Biology",
+        "Organized a charity marathon"
+    ]
+    
+    # Lines where a variation stands as a whole word
+    skill_lines = [
+        "Wrote Python scripts",
+        "Statistics in R",
+        "Services written in Go"
+    ]
+    
+    print("\nPrefilter results:")
+    for line in prose_lines + skill_lines:
+        print(f"- {line}: {extractor._may_contain_skill(line)}")
+    
+    for line in prose_lines:
+        assert not extractor._may_contain_skill(line), line
+    for line in skill_lines:
+        assert extractor._may_contain_skill(line), line
+    
+    logger.info("Prose lines are rejected by the prefilter")
+
+def test_mixed_delimiters():
+    """Test that lines and table cells split on every delimiter at once"""
+    extractor = SkillExtractor()
+    line = "Python, Java; SQL | Docker"
+    
+    # Section lines
+    section_skills = extractor._extract_from_lines([line], "skills_section")
+    print("\nSection line skills:")
+    for skill in section_skills:
+        print(f"- {skill['name']} (Confidence: {skill['confidence_score']})")
+        
+    assert [skill["name"] for skill in section_skills] == ["Python", "Java", "SQL", "Docker"]
+    assert all(skill["confidence_score"] == 0.8 for skill in section_skills)
+    
+    # Table cells are not split on bullets, so a bulleted cell is matched whole
+    # and yields one entry per skill in it, in no fixed order
+    table = {"page": 1, "content": [[line], ["Git • Linux"]]}
+    table_skills = extractor._extract_from_table(table, "table_content")
+    print("\nTable cell skills:")
+    for skill in table_skills:
+        print(f"- {skill['name']} ({skill['context']})")
+        
+    assert [skill["name"] for skill in table_skills[:4]] == ["Python", "Java", "SQL", "Docker"]
+    assert sorted(skill["name"] for skill in table_skills[4:]) == ["Git", "Linux"]
+    assert [skill["confidence_score"] for skill in table_skills] == [0.85, 0.85, 0.85, 0.85, 0.9, 0.9]
+    
+    # Documents with tables go through extract_skills without errors
+    document = {"document_type": "resume", "pages": [{"number": 1}], "structure": {"tables": [table]}}
+    skills, sections_with_skills = extractor.extract_skills(document)
+    assert sorted(skill["name"] for skill in skills) == ["Docker", "Git", "Java", "Linux", "Python", "SQL"]
+    
+    logger.info("Mixed-delimiter lines and cells are split as expected")
+
+if __name__ == "__main__":
+    test_prose_prefilter()
+    test_mixed_delimiters()